@@ -7,26 +7,91 @@ proven stable in Analysis 088:
 - TextOut Pydantic model (not response_model=str)
 - Strict JSON instruction prompt
 - System-first message ordering
-- max_completion_tokens=2048
+- max_completion_tokens=16, retried once at 2048 if the reply is truncated
 
 This module is the authoritative source for Bedrock health validation.
 The extension should use this instead of relying on Cognee's internal probe.
 """
 
+import asyncio
+import hashlib
+import logging
 import os
+import re
+import time
+from functools import lru_cache
+
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    """
+    Read a float setting from the environment.
+
+    A malformed value (e.g. "10s") logs a warning and falls back to the
+    default, so a bad override cannot break importing this module.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; using default %s", name, raw, default)
+        return default
+
 
 # =============================================================================
 # Constants - Proven Stable Configuration from Analysis 088
 # =============================================================================
 
+# Cross-region inference (CRIS) profile prefixes. These are part of the model
+# ID and must be preserved: stripping them makes Bedrock reject the call with
+# "on-demand throughput isn't supported".
+BEDROCK_CRIS_PREFIXES = ("us.", "eu.", "apac.", "us-gov.")
+
+# Region-routing path segment (e.g. "us-west-2/") some configs prepend
+_REGION_SEGMENT_RE = re.compile(r"^(?:[a-z]{2}(?:-gov)?-[a-z]+-\d+/)+")
+
+
+def _normalize_probe_model(model: str) -> str:
+    """
+    Normalize a configured model ID for the probe.
+
+    Preserves CRIS inference-profile prefixes (us./eu./apac./us-gov.) and
+    inference-profile ARNs; strips only leading region-routing segments.
+    """
+    model = model.strip()
+    if model.startswith("arn:"):
+        return model
+    return _REGION_SEGMENT_RE.sub("", model)
+
+
+def _has_cris_prefix(model: str) -> bool:
+    """Return True if the model is a CRIS inference profile ID or ARN."""
+    return model.startswith(BEDROCK_CRIS_PREFIXES) or ":inference-profile/" in model
+
+
 # Model to use for health probe - read from environment (set by VendResponse),
 # with fallback to nova-lite for cross-region inference compatibility
-BEDROCK_PROBE_MODEL = os.getenv("LLM_MODEL", "amazon.nova-lite-v1:0")
+BEDROCK_PROBE_MODEL = _normalize_probe_model(os.getenv("LLM_MODEL", "amazon.nova-lite-v1:0"))
+
+# Max tokens cap - the expected reply {"content": "test"} is ~8 tokens, so a
+# small cap bounds worst-case probe latency if the model ignores the prompt
+BEDROCK_PROBE_MAX_TOKENS = 16
 
-# Max tokens cap - proven stable in Analysis 088 (Bedrock rejects 16384 default)
-BEDROCK_PROBE_MAX_TOKENS = 2048
+# Cap used for a single retry when the reply is truncated - proven stable in
+# Analysis 088 (Bedrock rejects 16384 default)
+BEDROCK_PROBE_MAX_TOKENS_FALLBACK = 2048
+
+# Client-side deadline for each probe request, so a hung endpoint or DNS stall
+# cannot block extension startup indefinitely
+BEDROCK_PROBE_TIMEOUT_SEC = _env_float("BEDROCK_PROBE_TIMEOUT_SEC", 10.0)
+
+# Markers of a reply cut off by the token cap (instructor/litellm errors)
+_TRUNCATION_RE = re.compile(r"IncompleteOutput|max_tokens|EOF while parsing", re.IGNORECASE)
 
 # Strict JSON instruction - proven 20/20 clean in batch testing
 BEDROCK_PROBE_SYSTEM_PROMPT = (
@@ -38,6 +103,24 @@ BEDROCK_PROBE_SYSTEM_PROMPT = (
 # Simple test input
 BEDROCK_PROBE_TEXT_INPUT = "test"
 
+# Successful probe results are reused for this many seconds (per model and
+# credential set) so startup, retries and status refreshes share one roundtrip.
+# Failures are never cached so remediation flows re-probe immediately.
+BEDROCK_PROBE_TTL_SEC = _env_float("BEDROCK_PROBE_TTL_SEC", 45.0)
+
+# Latency-optimized inference (opt-in). Bedrock only honours
+# performanceConfig={"latency": "optimized"} for a subset of models, so the
+# flag is gated by both the env toggle and the allowlist below.
+BEDROCK_PROBE_LATENCY_OPTIMIZED = os.getenv(
+    "BEDROCK_PROBE_LATENCY_OPTIMIZED", ""
+).lower() in {"1", "true", "yes", "on"}
+
+BEDROCK_LATENCY_OPTIMIZED_MODELS = (
+    "amazon.nova-lite",
+    "amazon.nova-pro",
+    "anthropic.claude-3-5-haiku",
+)
+
 # Plan 088 Section 5.1: Embedding health decision
 # DEFERRED = embedding validation happens at first use with clear error
 # REPLACED = we have a replacement embedding pre-flight check
@@ -51,6 +134,45 @@ EMBEDDING_DEFERRED_ERROR_MESSAGE = (
 )
 
 
+# Error categorization table, in priority order (first match wins).
+# Each entry: (pattern, error_code, error prefix, remediation).
+_ERROR_TABLE = [
+    (
+        re.compile(r"expired", re.IGNORECASE),
+        "BEDROCK_AUTH_ERROR",
+        "AWS credentials expired",
+        "Run 'Flowbaby Cloud: Login' to refresh your credentials.",
+    ),
+    (
+        re.compile(r"AccessDenied|not authorized", re.IGNORECASE),
+        "BEDROCK_AUTH_ERROR",
+        "AWS access denied",
+        "Verify your Flowbaby Cloud subscription includes Bedrock access.",
+    ),
+    (
+        re.compile(r"UnrecognizedClient|security token", re.IGNORECASE),
+        "BEDROCK_AUTH_ERROR",
+        "Invalid AWS credentials",
+        "Run 'Flowbaby Cloud: Login' to obtain valid credentials.",
+    ),
+    (
+        re.compile(
+            r"ResourceNotFoundException|on-demand throughput|(?=.*model).*not found",
+            re.IGNORECASE | re.DOTALL,
+        ),
+        "BEDROCK_MODEL_ERROR",
+        "Bedrock model not available",
+        "The configured model may not be available in your AWS region.",
+    ),
+    (
+        re.compile(r"ValidationException|maximum tokens", re.IGNORECASE),
+        "BEDROCK_VALIDATION_ERROR",
+        "Bedrock request validation failed",
+        "This may be a configuration issue. Please report this error.",
+    ),
+]
+
+
 # =============================================================================
 # Response Model - Concrete Pydantic model (not str)
 # =============================================================================
@@ -70,6 +192,167 @@ class TextOut(BaseModel):
 # Health Check Function
 # =============================================================================
 
+# BedrockAdapter class, resolved on first use (see _load_bedrock_adapter)
+_BedrockAdapter = None
+
+
+def _load_bedrock_adapter():
+    """
+    Return Cognee's BedrockAdapter class, importing it on first use only.
+
+    The import is deferred (not done at module load) to avoid circular
+    imports and to keep Cognee from loading before the bridge environment
+    is configured. Failed imports are not cached, so installing missing
+    dependencies takes effect on the next probe.
+
+    Raises:
+        ImportError: If Cognee's Bedrock adapter is unavailable
+    """
+    global _BedrockAdapter
+    if _BedrockAdapter is None:
+        from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.bedrock.adapter import (
+            BedrockAdapter,
+        )
+        _BedrockAdapter = BedrockAdapter
+    return _BedrockAdapter
+
+
+# probe_model -> (credentials_fingerprint, monotonic timestamp, result).
+# Keyed by model only so credential rotations replace entries instead of
+# accumulating unreachable ones in the long-lived daemon.
+_PROBE_CACHE: dict = {}
+
+
+def invalidate_bedrock_health_cache() -> None:
+    """
+    Drop cached probe results and adapters.
+
+    Call after a credential refresh so the next health check re-probes
+    Bedrock with a freshly built client.
+    """
+    _PROBE_CACHE.clear()
+    _get_adapter.cache_clear()
+
+
+def _credentials_fingerprint() -> str:
+    """
+    Fingerprint the active AWS credentials so a credential refresh
+    ('Flowbaby Cloud: Login') produces a new adapter cache key.
+    """
+    token = "|".join(
+        os.environ.get(name, "")
+        for name in ("AWS_ACCESS_KEY_ID", "AWS_SESSION_TOKEN")
+    )
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _get_adapter(adapter_cls, model: str, credentials_fingerprint: str):
+    """
+    Build (once per adapter class, model and credential set) a BedrockAdapter
+    preconfigured for the probe, so repeated health checks skip boto3
+    credential resolution and client construction.
+
+    credentials_fingerprint is only used as part of the cache key.
+    """
+    adapter = adapter_cls(model=model)
+    adapter.max_completion_tokens = BEDROCK_PROBE_MAX_TOKENS
+    return adapter
+
+
+def _supports_latency_optimized(model: str) -> bool:
+    """
+    Return True if the model (or its us./eu. inference profile) is on the
+    latency-optimized allowlist.
+    """
+    return any(model_id in model for model_id in BEDROCK_LATENCY_OPTIMIZED_MODELS)
+
+
+def _categorize_error(error_str: str, model: str = None) -> dict:
+    """
+    Map a probe exception message to an actionable health result.
+
+    Walks _ERROR_TABLE in priority order; unmatched errors fall through to
+    BEDROCK_PROBE_FAILED. Model errors for IDs without a CRIS prefix get a
+    hint to switch to the inference-profile ID.
+    """
+    for pattern, error_code, prefix, remediation in _ERROR_TABLE:
+        if pattern.search(error_str):
+            if error_code == "BEDROCK_MODEL_ERROR" and model and not _has_cris_prefix(model):
+                remediation += " Try setting LLM_MODEL to the us./eu. inference-profile ID."
+            return {
+                "success": False,
+                "error": f"{prefix}: {error_str}",
+                "error_code": error_code,
+                "remediation": remediation,
+                "raw_content": None,
+            }
+    return {
+        "success": False,
+        "error": f"Bedrock probe failed: {error_str}",
+        "error_code": "BEDROCK_PROBE_FAILED",
+        "remediation": "Check your network connection and AWS credentials. Run 'Flowbaby Cloud: Login' to refresh.",
+        "raw_content": None,
+    }
+
+
+async def _run_probe(adapter, probe_model: str, max_tokens: int):
+    """
+    Build and send the probe request capped at max_tokens.
+
+    The cap is set on the request rather than the adapter, which is shared
+    through _get_adapter and must not change under concurrent probes.
+
+    Returns:
+        (content, truncated) where truncated is True if the reply was cut
+        off before the closing brace of the JSON object.
+    """
+    # Build request
+    request = adapter._create_bedrock_request(
+        text_input=BEDROCK_PROBE_TEXT_INPUT,
+        system_prompt=BEDROCK_PROBE_SYSTEM_PROMPT,
+        response_model=TextOut,
+    )
+
+    # Force system-first ordering (proven more stable in Analysis 088)
+    request["messages"] = [
+        {"role": "system", "content": BEDROCK_PROBE_SYSTEM_PROMPT},
+        {"role": "user", "content": BEDROCK_PROBE_TEXT_INPUT},
+    ]
+    request["max_completion_tokens"] = max_tokens
+
+    # Request latency-optimized inference when enabled and supported.
+    # litellm forwards performanceConfig to the Bedrock Converse API.
+    if BEDROCK_PROBE_LATENCY_OPTIMIZED and _supports_latency_optimized(probe_model):
+        request["performanceConfig"] = {"latency": "optimized"}
+
+    # Execute probe
+    try:
+        result = await asyncio.wait_for(
+            adapter.aclient.chat.completions.create(**request),
+            timeout=BEDROCK_PROBE_TIMEOUT_SEC,
+        )
+    except asyncio.TimeoutError:
+        raise
+    except Exception as e:
+        # Model/region combination rejected latency-optimized inference;
+        # retry once with standard latency before reporting a failure.
+        if "performanceConfig" not in request or "performanceConfig" not in str(e):
+            raise
+        request.pop("performanceConfig")
+        result = await asyncio.wait_for(
+            adapter.aclient.chat.completions.create(**request),
+            timeout=BEDROCK_PROBE_TIMEOUT_SEC,
+        )
+
+    # Structured replies were validated by instructor; raw text must at
+    # least close the JSON object to count as complete
+    if hasattr(result, 'content'):
+        return result.content, False
+    content = str(result)
+    return content, not content.rstrip().endswith("}")
+
+
 async def check_bedrock_health(model: str = None) -> dict:
     """
     Perform a Bedrock connectivity health check.
@@ -78,7 +361,7 @@ async def check_bedrock_health(model: str = None) -> dict:
     - TextOut response model
     - Strict JSON instruction
     - System-first message ordering
-    - max_completion_tokens=2048
+    - max_completion_tokens=16 (retried once at 2048 on truncation)
     
     Args:
         model: Optional model override (defaults to BEDROCK_PROBE_MODEL)
@@ -91,47 +374,48 @@ async def check_bedrock_health(model: str = None) -> dict:
             - remediation: str or None (actionable user guidance)
             - raw_content: str or None (the actual response content)
     """
+    probe_model = _normalize_probe_model(model) if model else BEDROCK_PROBE_MODEL
+
     try:
-        # Import here to avoid circular imports and allow testing
-        from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.bedrock.adapter import (
-            BedrockAdapter,
-        )
+        BedrockAdapter = _load_bedrock_adapter()
         
-        probe_model = model or BEDROCK_PROBE_MODEL
+        credentials_fingerprint = _credentials_fingerprint()
         
-        # Create adapter with proven configuration
-        adapter = BedrockAdapter(model=probe_model)
-        adapter.max_completion_tokens = BEDROCK_PROBE_MAX_TOKENS
+        # Serve a recent successful probe for the same credentials without
+        # another Bedrock roundtrip
+        cached = _PROBE_CACHE.get(probe_model)
+        if (
+            cached is not None
+            and cached[0] == credentials_fingerprint
+            and time.monotonic() - cached[1] < BEDROCK_PROBE_TTL_SEC
+        ):
+            return dict(cached[2])
         
-        # Build request
-        request = adapter._create_bedrock_request(
-            text_input=BEDROCK_PROBE_TEXT_INPUT,
-            system_prompt=BEDROCK_PROBE_SYSTEM_PROMPT,
-            response_model=TextOut,
-        )
+        # Reuse adapter with proven configuration (rebuilt on credential change)
+        adapter = _get_adapter(BedrockAdapter, probe_model, credentials_fingerprint)
         
-        # Force system-first ordering (proven more stable in Analysis 088)
-        request["messages"] = [
-            {"role": "system", "content": BEDROCK_PROBE_SYSTEM_PROMPT},
-            {"role": "user", "content": BEDROCK_PROBE_TEXT_INPUT},
-        ]
+        try:
+            content, truncated = await _run_probe(adapter, probe_model, BEDROCK_PROBE_MAX_TOKENS)
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            if not _TRUNCATION_RE.search(str(e)):
+                raise
+            truncated = True
         
-        # Execute probe
-        result = await adapter.aclient.chat.completions.create(**request)
+        # Reply was cut off by the small cap: retry once with the proven cap
+        if truncated:
+            content, _ = await _run_probe(adapter, probe_model, BEDROCK_PROBE_MAX_TOKENS_FALLBACK)
         
-        # Validate response
-        if hasattr(result, 'content'):
-            content = result.content
-        else:
-            content = str(result)
-        
-        return {
+        health_result = {
             "success": True,
             "error": None,
             "error_code": None,
             "remediation": None,
             "raw_content": content,
         }
+        _PROBE_CACHE[probe_model] = (credentials_fingerprint, time.monotonic(), health_result)
+        return dict(health_result)
         
     except ImportError as e:
         return {
@@ -142,58 +426,17 @@ async def check_bedrock_health(model: str = None) -> dict:
             "raw_content": None,
         }
         
-    except Exception as e:
-        error_str = str(e)
+    except asyncio.TimeoutError:
+        return {
+            "success": False,
+            "error": f"Bedrock probe timed out after {BEDROCK_PROBE_TIMEOUT_SEC:g}s",
+            "error_code": "BEDROCK_PROBE_TIMEOUT",
+            "remediation": "Check your network connection, VPN or proxy settings, then retry.",
+            "raw_content": None,
+        }
         
-        # Categorize error for actionable guidance
-        if "ExpiredToken" in error_str or "expired" in error_str.lower():
-            return {
-                "success": False,
-                "error": f"AWS credentials expired: {error_str}",
-                "error_code": "BEDROCK_AUTH_ERROR",
-                "remediation": "Run 'Flowbaby Cloud: Login' to refresh your credentials.",
-                "raw_content": None,
-            }
-        elif "AccessDenied" in error_str or "not authorized" in error_str.lower():
-            return {
-                "success": False,
-                "error": f"AWS access denied: {error_str}",
-                "error_code": "BEDROCK_AUTH_ERROR",
-                "remediation": "Verify your Flowbaby Cloud subscription includes Bedrock access.",
-                "raw_content": None,
-            }
-        elif "UnrecognizedClient" in error_str or "security token" in error_str.lower():
-            return {
-                "success": False,
-                "error": f"Invalid AWS credentials: {error_str}",
-                "error_code": "BEDROCK_AUTH_ERROR",
-                "remediation": "Run 'Flowbaby Cloud: Login' to obtain valid credentials.",
-                "raw_content": None,
-            }
-        elif "ResourceNotFoundException" in error_str or "model" in error_str.lower() and "not found" in error_str.lower():
-            return {
-                "success": False,
-                "error": f"Bedrock model not available: {error_str}",
-                "error_code": "BEDROCK_MODEL_ERROR",
-                "remediation": "The configured model may not be available in your AWS region.",
-                "raw_content": None,
-            }
-        elif "ValidationException" in error_str or "maximum tokens" in error_str.lower():
-            return {
-                "success": False,
-                "error": f"Bedrock request validation failed: {error_str}",
-                "error_code": "BEDROCK_VALIDATION_ERROR",
-                "remediation": "This may be a configuration issue. Please report this error.",
-                "raw_content": None,
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Bedrock probe failed: {error_str}",
-                "error_code": "BEDROCK_PROBE_FAILED",
-                "remediation": "Check your network connection and AWS credentials. Run 'Flowbaby Cloud: Login' to refresh.",
-                "raw_content": None,
-            }
+    except Exception as e:
+        return _categorize_error(str(e), probe_model)
 
 
 # =============================================================================
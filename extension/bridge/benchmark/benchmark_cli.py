@@ -13,11 +13,11 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from datetime import datetime, timezone
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from benchmark.benchmark_contract import (
     BenchmarkDataset,
@@ -28,6 +28,7 @@ from benchmark.benchmark_contract import (
     load_run,
     load_topics,
     load_qrels,
+    read_json,
     save_run_summary,
     validate_split_discipline,
     SplitDisciplineError,
@@ -40,6 +41,15 @@ from benchmark.benchmark_scorer import (
 )
 
 
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return (mtime_ns, size, inode) for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def load_dataset_from_dir(dataset_path: Path) -> BenchmarkDataset:
     """
     Load a benchmark dataset from a directory.
@@ -50,6 +60,10 @@ def load_dataset_from_dir(dataset_path: Path) -> BenchmarkDataset:
             qrels.json       - List of Qrel objects
             metadata.json    - Dataset metadata (id, version, slice_definitions)
 
+    Parsed datasets are cached per process, keyed by the directory and the
+    stat of each file, so repeated scoring passes over an unchanged dataset
+    skip re-parsing. Callers must treat the returned dataset as read-only.
+
     Args:
         dataset_path: Path to the dataset directory
 
@@ -59,22 +73,37 @@ def load_dataset_from_dir(dataset_path: Path) -> BenchmarkDataset:
     Raises:
         FileNotFoundError: If required files are missing
     """
-    topics_path = dataset_path / "topics.json"
-    qrels_path = dataset_path / "qrels.json"
-    metadata_path = dataset_path / "metadata.json"
+    topics_key = _stat_key(dataset_path / "topics.json")
+    qrels_key = _stat_key(dataset_path / "qrels.json")
+
+    if topics_key is None:
+        raise FileNotFoundError(f"Topics file not found: {dataset_path / 'topics.json'}")
+    if qrels_key is None:
+        raise FileNotFoundError(f"Qrels file not found: {dataset_path / 'qrels.json'}")
+
+    return _load_dataset_cached(
+        str(dataset_path),
+        topics_key,
+        qrels_key,
+        _stat_key(dataset_path / "metadata.json"),
+    )
 
-    if not topics_path.exists():
-        raise FileNotFoundError(f"Topics file not found: {topics_path}")
-    if not qrels_path.exists():
-        raise FileNotFoundError(f"Qrels file not found: {qrels_path}")
 
-    topics = load_topics(topics_path)
-    qrels = load_qrels(qrels_path)
+@lru_cache(maxsize=4)
+def _load_dataset_cached(
+    dataset_dir: str,
+    topics_key: Tuple[int, int, int],
+    qrels_key: Tuple[int, int, int],
+    metadata_key: Optional[Tuple[int, int, int]],
+) -> BenchmarkDataset:
+    """Parse a dataset directory; the stat keys only invalidate the cache."""
+    dataset_path = Path(dataset_dir)
+    topics = load_topics(dataset_path / "topics.json")
+    qrels = load_qrels(dataset_path / "qrels.json")
 
     # Load metadata (optional fields with defaults)
-    if metadata_path.exists():
-        with open(metadata_path) as f:
-            metadata = json.load(f)
+    if metadata_key is not None:
+        metadata = read_json(dataset_path / "metadata.json")
     else:
         metadata = {}
 
@@ -132,6 +161,10 @@ class BenchmarkCLI:
         self.dataset = load_dataset_from_dir(dataset_path)
         self.config = config or ScorerConfig()
         self.scorer = BenchmarkScorer(self.dataset, self.config)
+        self._topics_by_split, self._qrels_by_split = self._index_by_split()
+        self._scorer_by_split: Dict[str, BenchmarkScorer] = {}
+        # (selection_split, evaluation_split) pairs already validated
+        self._validated_pairs: Set[Tuple[str, str]] = set()
 
     def score(
         self,
@@ -160,25 +193,25 @@ class BenchmarkCLI:
         """
         # Plan 113 M4: Validate split discipline if selection_split provided
         if selection_split is not None:
-            validate_split_discipline(selection_split, evaluation_split or "test")
+            split_pair = (selection_split, evaluation_split or "test")
+            if split_pair not in self._validated_pairs:
+                validate_split_discipline(*split_pair)
+                self._validated_pairs.add(split_pair)
         
         # Load run
         run = load_run(run_path)
         
         # Filter to evaluation split if specified
         if evaluation_split is not None:
-            filtered_dataset = self._filter_dataset_to_split(evaluation_split)
-            scorer = BenchmarkScorer(filtered_dataset, self.config)
+            scorer = self._scorer_for_split(evaluation_split)
         else:
             scorer = self.scorer
-            filtered_dataset = self.dataset
         
         result = scorer.score_run(run)
 
         # Save JSON results
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(result.to_json())
+        output_path.write_bytes(result.to_json_bytes())
 
         # Save Markdown summary
         if markdown_path:
@@ -197,6 +230,41 @@ class BenchmarkCLI:
 
         return result
 
+    def _scorer_for_split(self, split: str) -> BenchmarkScorer:
+        """
+        Return a scorer over the split-filtered dataset, built once per split.
+
+        A cached scorer is rebuilt if self.config has been replaced since.
+        """
+        scorer = self._scorer_by_split.get(split)
+        if scorer is None or scorer.config is not self.config:
+            scorer = BenchmarkScorer(self._filter_dataset_to_split(split), self.config)
+            self._scorer_by_split[split] = scorer
+        return scorer
+
+    def _index_by_split(self) -> Tuple[Dict[str, List[Topic]], Dict[str, List[Qrel]]]:
+        """
+        Group topics and qrels by their topic's split assignment in one pass.
+
+        Returns:
+            (topics_by_split, qrels_by_split); topics without a split and
+            qrels for unknown queries are omitted.
+        """
+        topics_by_split: Dict[str, List[Topic]] = defaultdict(list)
+        split_by_query: Dict[str, str] = {}
+        for topic in self.dataset.topics:
+            if topic.split:
+                topics_by_split[topic.split].append(topic)
+                split_by_query[topic.query_id] = topic.split
+
+        qrels_by_split: Dict[str, List[Qrel]] = defaultdict(list)
+        for qrel in self.dataset.qrels:
+            split = split_by_query.get(qrel.query_id)
+            if split is not None:
+                qrels_by_split[split].append(qrel)
+
+        return dict(topics_by_split), dict(qrels_by_split)
+
     def _filter_dataset_to_split(self, split: str) -> BenchmarkDataset:
         """
         Create a filtered dataset containing only topics from the specified split.
@@ -207,28 +275,22 @@ class BenchmarkCLI:
         Returns:
             New BenchmarkDataset with only topics from the specified split
         """
-        filtered_topics = self.dataset.topics_by_split(split)
-        filtered_query_ids = {t.query_id for t in filtered_topics}
-        filtered_qrels = [q for q in self.dataset.qrels if q.query_id in filtered_query_ids]
-        
         return BenchmarkDataset(
             dataset_id=self.dataset.dataset_id,
             version=self.dataset.version,
-            topics=filtered_topics,
-            qrels=filtered_qrels,
+            topics=self._topics_by_split.get(split, []),
+            qrels=self._qrels_by_split.get(split, []),
             slice_definitions=self.dataset.slice_definitions,
         )
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Main CLI entrypoint.
-
-    Args:
-        argv: Command-line arguments (defaults to sys.argv[1:])
+    Build the CLI argument parser.
 
-    Returns:
-        Exit code (0 for success)
+    Cached so repeated main() calls (tests, embedded harnesses) construct it
+    once; parse_args() does not mutate the parser.
     """
     parser = argparse.ArgumentParser(
         prog="benchmark",
@@ -251,7 +313,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         "--run",
         type=Path,
         required=True,
-        help="Path to the run JSON file to score",
+        help="Path to the run file to score (.json, or .jsonl for JSON Lines; "
+        "JSON Lines is recommended for large runs)",
     )
     score_parser.add_argument(
         "--output",
@@ -281,6 +344,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=[5, 10, 20],
         help="K values for @K metrics (default: 5 10 20)",
     )
+    score_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for per-query scoring (default: 1, in-process)",
+    )
     # Plan 113 M4: Split discipline parameters
     score_parser.add_argument(
         "--selection-split",
@@ -295,11 +364,24 @@ def main(argv: Optional[List[str]] = None) -> int:
         help="Split to evaluate on (filters dataset to this split)",
     )
 
-    args = parser.parse_args(argv)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entrypoint.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 for success)
+    """
+    args = _build_parser().parse_args(argv)
 
     if args.command == "score":
         try:
-            config = ScorerConfig(k_values=args.k)
+            config = ScorerConfig(k_values=args.k, n_workers=args.workers)
             cli = BenchmarkCLI(dataset_path=args.dataset, config=config)
             cli.score(
                 run_path=args.run,
@@ -17,11 +17,34 @@ Per Step 0 decisions:
 
 from __future__ import annotations
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import sys
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Any
 from uuid import uuid5, NAMESPACE_DNS
 from collections import defaultdict
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator; stdlib json is the fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large run/qrels files are then parsed in one go
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; loaders then build dataclasses from parsed dicts
+    msgspec = None
 
 
 # ============================================================================
@@ -46,6 +69,22 @@ Valid values for Topic.split field.
 - test: For final evaluation only (NEVER use for selection)
 """
 
+STREAMING_PARSE_MIN_BYTES = 64 * 1024 * 1024
+"""
+Run and qrels files at least this large are stream-parsed with ijson (when
+installed) instead of being loaded into memory as one JSON tree.
+"""
+
+IO_BUFFER_SIZE = 1 << 20
+"""
+Buffer size (1 MiB) for file reads and writes done in many small pieces
+(JSON Lines, ijson streaming, stdlib json.dump), instead of the 8 KiB default.
+"""
+
+
+# Splits that must never be used for selection/tuning (Plan 113 M4)
+_INVALID_SELECTION_SPLITS = frozenset({"test"})
+
 
 class SplitDisciplineError(ValueError):
     """
@@ -72,9 +111,9 @@ def validate_split_discipline(
     Raises:
         SplitDisciplineError: If selection_split is "test"
     """
-    if selection_split == "test":
+    if selection_split in _INVALID_SELECTION_SPLITS:
         raise SplitDisciplineError(
-            f"Split discipline violation: cannot use 'test' split for selection/tuning. "
+            f"Split discipline violation: cannot use '{selection_split}' split for selection/tuning. "
             f"Use 'train' or 'validation' for selection, then evaluate on 'test'. "
             f"Got selection_split='{selection_split}', evaluation_split='{evaluation_split}'."
         )
@@ -91,7 +130,18 @@ def normalize_topic(topic: str) -> str:
     Rules:
     - Lowercase
     - Strip leading/trailing whitespace
+
+    Already-normalized ASCII topics are returned as-is, skipping two string
+    allocations on the common path.
     """
+    if (
+        topic
+        and topic.isascii()
+        and topic.islower()
+        and not topic[0].isspace()
+        and not topic[-1].isspace()
+    ):
+        return topic
     return topic.strip().lower()
 
 
@@ -121,23 +171,37 @@ def canonicalize_id(
         Canonical ID string, or None if item is non-canonical
     """
     # Case 1: topic_id present
-    if topic_id is not None and topic_id.strip():
-        return topic_id.strip()
+    if topic_id is not None:
+        stripped_id = topic_id.strip()
+        if stripped_id:
+            return sys.intern(stripped_id)
     
     # Case 2: topic present and non-empty
-    if topic is not None and topic.strip():
+    if topic is not None:
         normalized = normalize_topic(topic)
-        return str(uuid5(NAMESPACE_DNS, normalized))
+        if normalized:
+            return _topic_to_uuid(normalized)
     
     # Case 3: Neither present - non-canonical
     return None
 
 
+@lru_cache(maxsize=65536)
+def _topic_to_uuid(normalized_topic: str) -> str:
+    """
+    uuid5 of a normalized topic, memoized so repeated topics are hashed once.
+
+    The result is interned so downstream dict lookups on canonical IDs
+    compare repeated IDs by identity.
+    """
+    return sys.intern(str(uuid5(NAMESPACE_DNS, normalized_topic)))
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Topic:
     """
     A benchmark query/topic.
@@ -158,7 +222,7 @@ class Topic:
     split: Optional[str] = None  # Plan 113 M4: train/validation/test
 
 
-@dataclass
+@dataclass(slots=True)
 class Qrel:
     """
     A relevance judgment (query-level relevance for an item).
@@ -173,7 +237,7 @@ class Qrel:
     relevance: int = 1  # Default to binary relevant
 
 
-@dataclass
+@dataclass(slots=True)
 class RunEntry:
     """
     A single entry in a benchmark run (one retrieved item for one query).
@@ -190,7 +254,7 @@ class RunEntry:
     score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Run:
     """
     A complete benchmark run (all retrieved items for all queries).
@@ -204,13 +268,148 @@ class Run:
     
     def entries_by_query(self) -> Dict[str, List[RunEntry]]:
         """Group entries by query ID."""
+        # append() growth is amortized O(1); pre-sizing each list from a
+        # counting pass and filling by index measured 3-4x slower in CPython.
         result: Dict[str, List[RunEntry]] = defaultdict(list)
         for entry in self.entries:
             result[entry.query_id].append(entry)
         return dict(result)
 
+    def iter_by_query(self) -> Iterator[Tuple[str, List[RunEntry]]]:
+        """
+        Yield (query_id, entries) per query, in first-appearance order.
+
+        Runs are normally written query by query, so each query's entries
+        are contiguous; they are then yielded one slice at a time, and only
+        the slice being consumed is alive instead of a full grouping dict.
+        Runs with interleaved queries fall back to entries_by_query().
+        """
+        entries = self.entries
+        starts: List[int] = []
+        seen: set = set()
+        previous = None
+        for i, entry in enumerate(entries):
+            query_id = entry.query_id
+            if query_id != previous:
+                if query_id in seen:
+                    yield from self.entries_by_query().items()
+                    return
+                seen.add(query_id)
+                starts.append(i)
+                previous = query_id
+        starts.append(len(entries))
+        for start, end in zip(starts, starts[1:]):
+            yield entries[start].query_id, entries[start:end]
+
+    def to_arrays(self, score_dtype: str = "float64") -> RunArrays:
+        """
+        Build a columnar (structure-of-arrays) view of the entries.
+
+        Args:
+            score_dtype: numpy dtype for scores. Pass "float32" to halve the
+                memory traffic of score sorts when scores are only used for
+                ordering; distinct scores closer than float32 precision then
+                tie (and keep entry order in order_by_score).
+
+        Requires numpy (already a dependency of pytrec_eval).
+        """
+        import numpy as np
+
+        n = len(self.entries)
+        query_labels: List[str] = []
+        code_of: Dict[str, int] = {}
+        query_codes = np.empty(n, dtype=np.int32)
+        item_ids = np.empty(n, dtype=object)
+        ranks = np.empty(n, dtype=np.int32)
+        scores = np.empty(n, dtype=score_dtype)
+        for i, entry in enumerate(self.entries):
+            code = code_of.get(entry.query_id)
+            if code is None:
+                code = code_of[entry.query_id] = len(query_labels)
+                query_labels.append(entry.query_id)
+            query_codes[i] = code
+            item_ids[i] = entry.canonical_item_id
+            ranks[i] = entry.rank
+            scores[i] = entry.score
+        return RunArrays(
+            run_id=self.run_id,
+            query_labels=query_labels,
+            query_codes=query_codes,
+            item_ids=item_ids,
+            ranks=ranks,
+            scores=scores,
+        )
+
+
+@dataclass(slots=True)
+class RunArrays:
+    """
+    Columnar view of a Run, one numpy array per RunEntry field.
+
+    Query IDs are dictionary-encoded: query_codes[i] indexes query_labels,
+    so grouping and sorting by query run on int32 codes instead of strings.
+
+    Attributes:
+        run_id: Identifier of the source run
+        query_labels: Distinct query IDs, in order of first appearance
+        query_codes: int32 index into query_labels for each entry
+        item_ids: Canonical item ID for each entry (object array)
+        ranks: int32 rank for each entry
+        scores: Score for each entry (float64 unless built with score_dtype)
+    """
+    run_id: str
+    query_labels: List[str]
+    query_codes: np.ndarray
+    item_ids: np.ndarray
+    ranks: np.ndarray
+    scores: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.query_codes)
+
+    def indices_by_query(self) -> Dict[str, np.ndarray]:
+        """
+        Map query ID -> entry indices, in original entry order.
+
+        Columnar counterpart of Run.entries_by_query: one stable argsort of
+        the query codes, with each query's indices returned as a view.
+        """
+        import numpy as np
+
+        order = np.argsort(self.query_codes, kind='stable')
+        offsets = self.query_offsets().tolist()
+        return {
+            label: order[offsets[code]:offsets[code + 1]]
+            for code, label in enumerate(self.query_labels)
+        }
+
+    def query_offsets(self) -> np.ndarray:
+        """
+        Segment boundaries of each query in query-code order.
+
+        Entries of query code c occupy [offsets[c], offsets[c + 1]) in any
+        ordering sorted by query code (indices_by_query, order_by_score).
+        """
+        import numpy as np
+
+        offsets = np.zeros(len(self.query_labels) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.query_codes, minlength=len(self.query_labels)), out=offsets[1:])
+        return offsets
 
-@dataclass
+    def order_by_score(self) -> np.ndarray:
+        """
+        Entry indices grouped by query code, highest score first within each query.
+
+        A single lexsort over (query code, -score); ties keep their original
+        entry order. Slice the result with query_offsets() for per-query
+        rankings, e.g. to reassign ranks from scores.
+        """
+        import numpy as np
+
+        return np.lexsort((-self.scores, self.query_codes))
+
+
+@dataclass(slots=True)
 class RunSummary:
     """
     Run-level provenance and telemetry per Plan 112 requirements.
@@ -268,7 +467,7 @@ class RunSummary:
     evaluation_split: Optional[str] = None  # Split used for final evaluation
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkDataset:
     """
     A complete benchmark dataset (topics + qrels + metadata).
@@ -279,27 +478,44 @@ class BenchmarkDataset:
         topics: List of all topics/queries
         qrels: List of all relevance judgments
         slice_definitions: Description of each slice
+
+    qrels_by_query() and topics_by_slice() are memoized. The cached grouping
+    is rebuilt when the qrels/topics list is replaced or changes length;
+    it is returned as a read-only mapping of tuples.
     """
     dataset_id: str
     version: str
     topics: List[Topic]
     qrels: List[Qrel]
     slice_definitions: Dict[str, str]
+    # Memoized groupings: (source list, its length, grouping)
+    _qrels_by_query_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _topics_by_slice_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
-    def qrels_by_query(self) -> Dict[str, List[Qrel]]:
+    def qrels_by_query(self) -> Mapping[str, Tuple[Qrel, ...]]:
         """Group qrels by query ID."""
+        cached = self._qrels_by_query_cache
+        if cached is not None and cached[0] is self.qrels and cached[1] == len(self.qrels):
+            return MappingProxyType(cached[2])
         result: Dict[str, List[Qrel]] = defaultdict(list)
         for qrel in self.qrels:
             result[qrel.query_id].append(qrel)
-        return dict(result)
+        grouped = {k: tuple(v) for k, v in result.items()}
+        self._qrels_by_query_cache = (self.qrels, len(self.qrels), grouped)
+        return MappingProxyType(grouped)
     
-    def topics_by_slice(self) -> Dict[str, List[Topic]]:
+    def topics_by_slice(self) -> Mapping[str, Tuple[Topic, ...]]:
         """Group topics by slice ID."""
+        cached = self._topics_by_slice_cache
+        if cached is not None and cached[0] is self.topics and cached[1] == len(self.topics):
+            return MappingProxyType(cached[2])
         result: Dict[str, List[Topic]] = defaultdict(list)
         for topic in self.topics:
             for slice_id in topic.slice_ids:
                 result[slice_id].append(topic)
-        return dict(result)
+        grouped = {k: tuple(v) for k, v in result.items()}
+        self._topics_by_slice_cache = (self.topics, len(self.topics), grouped)
+        return MappingProxyType(grouped)
     
     def topics_by_split(self, split: str) -> List[Topic]:
         """
@@ -334,58 +550,347 @@ class BenchmarkDataset:
 # File I/O
 # ============================================================================
 
-def _dataclass_to_dict(obj: Any) -> Any:
-    """Convert dataclass to dict, handling nested dataclasses."""
-    if hasattr(obj, '__dataclass_fields__'):
-        return {k: _dataclass_to_dict(v) for k, v in asdict(obj).items()}
-    elif isinstance(obj, list):
-        return [_dataclass_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: _dataclass_to_dict(v) for k, v in obj.items()}
-    return obj
+# Per-type field extractor: (field names, getter returning all values), or
+# None for non-dataclass types. _UNSEEN marks types not looked up yet.
+_FIELD_EXTRACTORS: Dict[type, Optional[Tuple[Tuple[str, ...], Callable[[Any], tuple]]]] = {}
+_UNSEEN = object()
+
+
+def _field_extractor(cls: type) -> Optional[Tuple[Tuple[str, ...], Callable[[Any], tuple]]]:
+    """Return the cached (names, getter) pair for a dataclass type, None otherwise."""
+    extractor = _FIELD_EXTRACTORS.get(cls, _UNSEEN)
+    if extractor is not _UNSEEN:
+        return extractor
+    extractor = None
+    if is_dataclass(cls):
+        # Like orjson, skip private fields (e.g. memoization caches)
+        names = tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+        if len(names) == 1:
+            getter = attrgetter(names[0])
+            extractor = (names, lambda obj: (getter(obj),))
+        elif names:
+            extractor = (names, attrgetter(*names))
+        else:
+            extractor = (names, lambda obj: ())
+    _FIELD_EXTRACTORS[cls] = extractor
+    return extractor
+
+
+def read_json(filepath: Path) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+
+    The file is read as bytes in one call and handed to the parser
+    directly; both orjson and json.loads accept UTF-8 bytes.
+    """
+    return _parse_json(Path(filepath).read_bytes())
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _msgspec_decoder(type_: Any) -> Any:
+    """Build (once per type) a msgspec JSON decoder for a contract type."""
+    return msgspec.json.Decoder(type_)
+
+
+def _decode_typed(data: bytes, type_: Any) -> Any:
+    """
+    Decode JSON bytes straight into contract dataclasses with msgspec.
+
+    msgspec builds the dataclasses in C without intermediate dicts. Returns
+    None when msgspec is not installed or the document does not match the
+    declared field types (e.g. a float rank); callers then fall back to the
+    lenient dict-based loader, so accepted files and error messages are the
+    same with or without msgspec.
+    """
+    if msgspec is None:
+        return None
+    try:
+        return _msgspec_decoder(type_).decode(data)
+    except msgspec.MsgspecError:
+        return None
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dump hook: emit dataclasses field by field (matches orjson's native output)."""
+    extractor = _field_extractor(type(obj))
+    if extractor is not None:
+        names, getter = extractor
+        return dict(zip(names, getter(obj)))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(data: Any, filepath: Path) -> None:
+    """
+    Write data as 2-space indented JSON, using orjson when it is installed.
+
+    Dataclasses (including nested ones) are serialized directly, without an
+    intermediate dict copy.
+    """
+    if orjson is not None:
+        Path(filepath).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(filepath, 'w', buffering=IO_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2, default=_json_default)
+
+
+def _advise_sequential(f: Any) -> None:
+    """
+    Hint the kernel that an open file will be read front to back.
+
+    Doubles readahead for the incremental readers on Linux. Best effort: a
+    no-op where posix_fadvise is unavailable or rejected.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _uniform_optional_keys(
+    data: Any, optional_keys: Tuple[str, ...], required_count: int
+) -> Optional[Tuple[bool, ...]]:
+    """
+    Decide once per file which optional keys the records carry.
+
+    Presence is read from the first record, which must hold only the
+    required and known optional keys; every record must then have the same
+    number of keys. Loaders use the returned flags to subscript directly
+    instead of probing each record with .get(). A record with a different
+    key set surfaces as a KeyError there, and the loader falls back to its
+    per-record path.
+
+    Returns None when records are not uniform (or not dicts).
+    """
+    if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+        return None
+    first = data[0]
+    flags = tuple(key in first for key in optional_keys)
+    width = required_count + sum(flags)
+    if len(first) != width:
+        return None
+    try:
+        if any(len(record) != width for record in data):
+            return None
+    except TypeError:
+        return None
+    return flags
+
+
+def _topic_from_dict(t: Dict[str, Any]) -> Topic:
+    """Build a Topic from one parsed record; optional keys may be absent."""
+    return Topic(
+        query_id=sys.intern(t["query_id"]),
+        query_text=t["query_text"],
+        slice_ids=t["slice_ids"],
+        notes=t.get("notes"),
+        expected_positive_count=t.get("expected_positive_count"),
+        split=t.get("split"),  # Plan 113 M4
+    )
+
+
+def _qrel_from_dict(q: Dict[str, Any]) -> Qrel:
+    """Build a Qrel from one parsed record; relevance defaults to 1."""
+    return Qrel(
+        query_id=sys.intern(q["query_id"]),
+        canonical_item_id=sys.intern(q["canonical_item_id"]),
+        relevance=q.get("relevance", 1),
+    )
+
+
+def _run_entry_from_dict(e: Dict[str, Any]) -> RunEntry:
+    """Build a RunEntry from one parsed record."""
+    return RunEntry(
+        query_id=sys.intern(e["query_id"]),
+        canonical_item_id=sys.intern(e["canonical_item_id"]),
+        rank=e["rank"],
+        score=e["score"],
+    )
 
 
 def load_topics(filepath: Path) -> List[Topic]:
-    """Load topics from JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
-    return [
-        Topic(
-            query_id=t["query_id"],
-            query_text=t["query_text"],
-            slice_ids=t["slice_ids"],
-            notes=t.get("notes"),
-            expected_positive_count=t.get("expected_positive_count"),
-            split=t.get("split"),  # Plan 113 M4
-        )
-        for t in data
-    ]
+    """Load topics from JSON file (query IDs are interned)."""
+    raw = Path(filepath).read_bytes()
+    intern = sys.intern
+    topics = _decode_typed(raw, List[Topic])
+    if topics is not None:
+        for t in topics:
+            t.query_id = intern(t.query_id)
+        return topics
+    # Records are built from top-level array elements only; nested values
+    # (e.g. a dict in notes) stay as parsed, whichever parser is used
+    data = _parse_json(raw)
+    flags = _uniform_optional_keys(data, ("notes", "expected_positive_count", "split"), 3)
+    if flags is not None:
+        has_notes, has_expected, has_split = flags
+        try:
+            return [
+                Topic(
+                    intern(t["query_id"]),
+                    t["query_text"],
+                    t["slice_ids"],
+                    t["notes"] if has_notes else None,
+                    t["expected_positive_count"] if has_expected else None,
+                    t["split"] if has_split else None,
+                )
+                for t in data
+            ]
+        except (KeyError, TypeError):
+            pass  # Key sets differ between records
+    return [_topic_from_dict(t) for t in data]
+
+
+def load_qrels_streaming(filepath: Path) -> List[Qrel]:
+    """
+    Load a JSON qrels file incrementally with ijson.
+
+    Each array element becomes a Qrel as soon as it is parsed, so the full
+    JSON tree is never materialized alongside the qrel list. Requires ijson.
+    """
+    with open(filepath, 'rb') as f:
+        _advise_sequential(f)
+        qrels: List[Qrel] = []
+        append = qrels.append
+        for q in ijson.items(f, 'item', buf_size=IO_BUFFER_SIZE):
+            append(_qrel_from_dict(q))
+    return qrels
 
 
 def load_qrels(filepath: Path) -> List[Qrel]:
-    """Load qrels from JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
-    return [
-        Qrel(
-            query_id=q["query_id"],
-            canonical_item_id=q["canonical_item_id"],
-            relevance=q.get("relevance", 1),
-        )
-        for q in data
-    ]
+    """
+    Load qrels from JSON file (ID fields are interned).
+
+    Files of at least STREAMING_PARSE_MIN_BYTES are streamed with ijson when
+    it is installed, as in load_run.
+    """
+    if ijson is not None and Path(filepath).stat().st_size >= STREAMING_PARSE_MIN_BYTES:
+        return load_qrels_streaming(filepath)
+    raw = Path(filepath).read_bytes()
+    intern = sys.intern
+    qrels = _decode_typed(raw, List[Qrel])
+    if qrels is not None:
+        for q in qrels:
+            q.query_id = intern(q.query_id)
+            q.canonical_item_id = intern(q.canonical_item_id)
+        return qrels
+    data = _parse_json(raw)
+    flags = _uniform_optional_keys(data, ("relevance",), 2)
+    if flags is not None:
+        (has_relevance,) = flags
+        try:
+            return [
+                Qrel(
+                    intern(q["query_id"]),
+                    intern(q["canonical_item_id"]),
+                    q["relevance"] if has_relevance else 1,
+                )
+                for q in data
+            ]
+        except (KeyError, TypeError):
+            pass  # Key sets differ between records
+    return [_qrel_from_dict(q) for q in data]
+
+
+def iter_run_entries_jsonl(filepath: Path) -> Iterator[RunEntry]:
+    """
+    Stream run entries from a JSON Lines run file.
+
+    Lines are parsed one at a time, so the raw file and its parsed JSON
+    tree are never held in memory at once. The first line is the run_id
+    header and is skipped; blank lines are skipped. Every other line must be
+    a full RunEntry record (a missing field raises KeyError, as in load_run).
+    """
+    with open(filepath, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        _advise_sequential(f)
+        f.readline()  # Header line
+        yield from _iter_jsonl_entry_lines(f)
+
+
+def _iter_jsonl_entry_lines(f: Any) -> Iterator[RunEntry]:
+    """Build a RunEntry from each non-blank line left in an open JSON Lines run."""
+    loads = orjson.loads if orjson is not None else json.loads
+    for line in f:
+        if not line.strip():
+            continue
+        yield _run_entry_from_dict(loads(line))
+
+
+def load_run_jsonl(filepath: Path) -> Run:
+    """
+    Load run from a JSON Lines file.
+
+    Format: first line is a header {"run_id": ...}; each following line is
+    one RunEntry object.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(filepath, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        _advise_sequential(f)
+        run_id = loads(f.readline())["run_id"]
+        entries = list(_iter_jsonl_entry_lines(f))
+    return Run(run_id=run_id, entries=entries)
+
+
+def load_run_streaming(filepath: Path) -> Run:
+    """
+    Load a JSON run file incrementally with ijson.
+
+    Each element of "entries" becomes a RunEntry as soon as it is parsed, so
+    the full JSON tree is never materialized alongside the entry list.
+    Requires ijson.
+    """
+    with open(filepath, 'rb') as f:
+        _advise_sequential(f)
+        run_id = next(ijson.items(f, 'run_id'), None)
+        if run_id is None:
+            # Match the other load_run paths; a bare StopIteration would leak
+            # out of (and silently end) any generator calling load_run
+            raise KeyError("run_id")
+        f.seek(0)
+        entries: List[RunEntry] = []
+        append = entries.append
+        for e in ijson.items(f, 'entries.item', use_float=True, buf_size=IO_BUFFER_SIZE):
+            append(_run_entry_from_dict(e))
+    return Run(run_id=run_id, entries=entries)
 
 
 def load_run(filepath: Path) -> Run:
-    """Load run from JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
+    """
+    Load run from JSON file (or JSON Lines, for a .jsonl suffix).
+
+    JSON files of at least STREAMING_PARSE_MIN_BYTES are streamed with ijson
+    when it is installed; smaller files are parsed in one go, which is faster,
+    and decoded straight into RunEntry objects when msgspec is installed.
+
+    query_id and canonical_item_id are interned on every load path: runs
+    repeat a few hundred query IDs across many entries, so each distinct ID
+    is stored once and dict lookups on matching IDs short-circuit on identity.
+    """
+    if Path(filepath).suffix == ".jsonl":
+        return load_run_jsonl(filepath)
+    if ijson is not None and Path(filepath).stat().st_size >= STREAMING_PARSE_MIN_BYTES:
+        return load_run_streaming(filepath)
+    raw = Path(filepath).read_bytes()
+    intern = sys.intern
+    run = _decode_typed(raw, Run)
+    if run is not None:
+        for e in run.entries:
+            e.query_id = intern(e.query_id)
+            e.canonical_item_id = intern(e.canonical_item_id)
+        return run
+    data = _parse_json(raw)
     return Run(
         run_id=data["run_id"],
         entries=[
             RunEntry(
-                query_id=e["query_id"],
-                canonical_item_id=e["canonical_item_id"],
+                query_id=intern(e["query_id"]),
+                canonical_item_id=intern(e["canonical_item_id"]),
                 rank=e["rank"],
                 score=e["score"],
             )
@@ -394,49 +899,104 @@ def load_run(filepath: Path) -> Run:
     )
 
 
+def _topic_rows(topics: List[Topic]) -> List[Dict[str, Any]]:
+    """Topics as JSON-ready dicts, in field order."""
+    return [
+        {
+            "query_id": t.query_id,
+            "query_text": t.query_text,
+            "slice_ids": t.slice_ids,
+            "notes": t.notes,
+            "expected_positive_count": t.expected_positive_count,
+            "split": t.split,
+        }
+        for t in topics
+    ]
+
+
+def _qrel_rows(qrels: List[Qrel]) -> List[Dict[str, Any]]:
+    """Qrels as JSON-ready dicts, in field order."""
+    return [
+        {"query_id": q.query_id, "canonical_item_id": q.canonical_item_id, "relevance": q.relevance}
+        for q in qrels
+    ]
+
+
+def _run_entry_rows(entries: List[RunEntry]) -> List[Dict[str, Any]]:
+    """Run entries as JSON-ready dicts, in field order."""
+    return [
+        {"query_id": e.query_id, "canonical_item_id": e.canonical_item_id, "rank": e.rank, "score": e.score}
+        for e in entries
+    ]
+
+
 def save_run(run: Run, filepath: Path) -> None:
-    """Save run to JSON file."""
-    data = _dataclass_to_dict(run)
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    """
+    Save run to JSON file.
+
+    Entries are written via plain row dicts: orjson encodes dicts several
+    times faster than slotted dataclasses, which it reads attribute by
+    attribute, so building the rows first is still a net win.
+    """
+    write_json({"run_id": run.run_id, "entries": _run_entry_rows(run.entries)}, filepath)
+
+
+def save_run_jsonl(run: Run, filepath: Path) -> None:
+    """Save run as JSON Lines: a {"run_id": ...} header, then one entry per line."""
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+    with open(filepath, 'wb', buffering=IO_BUFFER_SIZE) as f:
+        f.write(dumps({"run_id": run.run_id}) + b"\n")
+        for entry in run.entries:
+            f.write(dumps({
+                "query_id": entry.query_id,
+                "canonical_item_id": entry.canonical_item_id,
+                "rank": entry.rank,
+                "score": entry.score,
+            }) + b"\n")
 
 
 def save_run_summary(summary: RunSummary, filepath: Path) -> None:
     """Save run summary to JSON file."""
-    data = _dataclass_to_dict(summary)
-    # Remove None values for cleaner output
-    data = {k: v for k, v in data.items() if v is not None}
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Remove None values for cleaner output; field values are written as-is
+    data = {
+        f.name: value
+        for f in fields(summary)
+        if (value := getattr(summary, f.name)) is not None
+    }
+    write_json(data, filepath)
 
 
 def save_topics(topics: List[Topic], filepath: Path) -> None:
     """Save topics to JSON file."""
-    data = [_dataclass_to_dict(t) for t in topics]
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(_topic_rows(topics), filepath)
 
 
 def save_qrels(qrels: List[Qrel], filepath: Path) -> None:
     """Save qrels to JSON file."""
-    data = [_dataclass_to_dict(q) for q in qrels]
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(_qrel_rows(qrels), filepath)
 
 
-def save_dataset(dataset: BenchmarkDataset, directory: Path) -> None:
-    """Save complete dataset to a directory."""
-    directory.mkdir(parents=True, exist_ok=True)
-    
-    # Save metadata
+def _save_metadata(dataset: BenchmarkDataset, directory: Path) -> None:
+    """Write metadata.json for a dataset directory."""
     metadata = {
         "dataset_id": dataset.dataset_id,
         "version": dataset.version,
         "slice_definitions": dataset.slice_definitions,
         "canonicalization_version": CANONICALIZATION_VERSION,
     }
-    with open(directory / "metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
+    write_json(metadata, directory / "metadata.json")
+
+
+def save_dataset(dataset: BenchmarkDataset, directory: Path) -> None:
+    """Save complete dataset to a directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # Save metadata
+    _save_metadata(dataset, directory)
     
     # Save topics and qrels
     save_topics(dataset.topics, directory / "topics.json")
@@ -445,8 +1005,7 @@ def save_dataset(dataset: BenchmarkDataset, directory: Path) -> None:
 
 def load_dataset(directory: Path) -> BenchmarkDataset:
     """Load complete dataset from a directory."""
-    with open(directory / "metadata.json") as f:
-        metadata = json.load(f)
+    metadata = read_json(directory / "metadata.json")
     
     topics = load_topics(directory / "topics.json")
     qrels = load_qrels(directory / "qrels.json")
@@ -458,3 +1017,71 @@ def load_dataset(directory: Path) -> BenchmarkDataset:
         qrels=qrels,
         slice_definitions=metadata.get("slice_definitions", {}),
     )
+
+
+def save_dataset_parquet(dataset: BenchmarkDataset, directory: Path) -> None:
+    """
+    Save a dataset with topics and qrels as zstd-compressed Parquet.
+
+    Writes topics.parquet and qrels.parquet (IDs dictionary-encoded,
+    relevance as int8) next to the usual metadata.json. Intended for large
+    generated datasets; hand-curated datasets stay JSON so they can be
+    reviewed in diffs. Requires pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    directory.mkdir(parents=True, exist_ok=True)
+    _save_metadata(dataset, directory)
+
+    id_type = pa.dictionary(pa.int32(), pa.string())
+    topics = dataset.topics
+    topics_table = pa.table({
+        "query_id": pa.array([t.query_id for t in topics], pa.string()),
+        "query_text": pa.array([t.query_text for t in topics], pa.string()),
+        "slice_ids": pa.array([t.slice_ids for t in topics], pa.list_(pa.string())),
+        "notes": pa.array([t.notes for t in topics], pa.string()),
+        "expected_positive_count": pa.array([t.expected_positive_count for t in topics], pa.int32()),
+        "split": pa.array([t.split for t in topics], id_type),
+    })
+    qrels = dataset.qrels
+    qrels_table = pa.table({
+        "query_id": pa.array([q.query_id for q in qrels], id_type),
+        "canonical_item_id": pa.array([q.canonical_item_id for q in qrels], id_type),
+        "relevance": pa.array([q.relevance for q in qrels], pa.int8()),
+    })
+    pq.write_table(topics_table, directory / "topics.parquet", compression="zstd")
+    pq.write_table(qrels_table, directory / "qrels.parquet", compression="zstd")
+
+
+def load_dataset_parquet(directory: Path) -> BenchmarkDataset:
+    """Load a dataset written by save_dataset_parquet. Requires pyarrow."""
+    import pyarrow.parquet as pq
+
+    metadata = read_json(directory / "metadata.json")
+
+    # Convert column by column: no per-row dicts from Table.to_pylist()
+    t = pq.read_table(directory / "topics.parquet")
+    topics = [
+        Topic(sys.intern(query_id), query_text, slice_ids, notes, expected_positive_count, split)
+        for query_id, query_text, slice_ids, notes, expected_positive_count, split in zip(
+            *(t.column(name).to_pylist() for name in (
+                "query_id", "query_text", "slice_ids", "notes", "expected_positive_count", "split",
+            ))
+        )
+    ]
+    q = pq.read_table(directory / "qrels.parquet")
+    qrels = [
+        Qrel(sys.intern(query_id), sys.intern(canonical_item_id), relevance)
+        for query_id, canonical_item_id, relevance in zip(
+            *(q.column(name).to_pylist() for name in ("query_id", "canonical_item_id", "relevance"))
+        )
+    ]
+
+    return BenchmarkDataset(
+        dataset_id=metadata["dataset_id"],
+        version=metadata["version"],
+        topics=topics,
+        qrels=qrels,
+        slice_definitions=metadata.get("slice_definitions", {}),
+    )
@@ -1,7 +1,7 @@
 """
 Benchmark Scorer for Flowbaby Retrieval Evaluation (Step 2)
 
-Implements scoring harness using ir_measures + pytrec_eval for:
+Implements scoring harness using pytrec_eval (ir_measures-compatible output) for:
 - Recall@K, Precision@K, MRR, MAP@K, nDCG@K
 
 All computation is offline-only (no network, no LLM calls).
@@ -10,26 +10,36 @@ All computation is offline-only (no network, no LLM calls).
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field, asdict
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator, Sequence
 
-import ir_measures
-from ir_measures import Recall, Precision, RR, AP, nDCG
+import numpy as np  # Already loaded by pytrec_eval
+import pytrec_eval
 
 from benchmark.benchmark_contract import (
     BenchmarkDataset,
     Run,
+    RunEntry,
     RunSummary,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator; stdlib json is the fallback
+    orjson = None
+
 
 # Default K values tied to Flowbaby UX surfaces
 # K=5 is primary because chat/command surfaces show top-5 retrieved items
 DEFAULT_K_VALUES: list[int] = [5, 10, 20]
 
+# Slices of a topic without slice_ids; one shared immutable tuple
+_DEFAULT_SLICES: tuple[str, ...] = ("default",)
+
 
-@dataclass
+@dataclass(slots=True)
 class ScorerConfig:
     """Configuration for the benchmark scorer."""
 
@@ -38,13 +48,20 @@ class ScorerConfig:
         default_factory=lambda: ["recall", "precision", "mrr", "map", "ndcg"]
     )
     relevance_mode: str = "binary"  # "binary" or "graded"
+    # Worker processes for per-query scoring; 1 scores in-process. Pool
+    # startup costs more than it saves on small datasets like golden-v1.
+    n_workers: int = 1
+    # Results of the most recent score_run calls kept per run_id, so scoring
+    # the same Run again is free; 0 disables. Cached runs stay referenced
+    # until evicted, so keep this small for sweeps over large runs.
+    result_cache_size: int = 0
 
     def __post_init__(self):
         if not self.k_values:
             self.k_values = DEFAULT_K_VALUES.copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelShapeStats:
     """
     Statistics about the positives-per-query distribution (Plan 113 M2).
@@ -62,7 +79,17 @@ class LabelShapeStats:
     total_queries: int
 
 
-@dataclass
+def _sorted_by_key(d: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy a dict with its keys in sorted order (only this level is sorted).
+
+    Sorting the keys alone compares plain strings, roughly twice as fast as
+    sorting (key, value) item tuples.
+    """
+    return {key: d[key] for key in sorted(d)}
+
+
+@dataclass(slots=True)
 class ScoreResult:
     """
     Result of scoring a benchmark run.
@@ -83,14 +110,45 @@ class ScoreResult:
     label_shape_stats: LabelShapeStats | None = None
     macro_metrics: dict[str, float] = field(default_factory=dict)
 
-    def to_json(self) -> str:
-        """Serialize to JSON for machine-readable output with stable ordering."""
+    def to_json(self, pretty: bool = True) -> str:
+        """
+        Serialize to JSON for machine-readable output with stable ordering.
+
+        pretty=False emits compact JSON (no indentation or spaces). Uses
+        orjson when installed; without it, compact output is encoded in C by
+        the stdlib and indented output goes through json's pure-Python encoder.
+        The two encoders may spell some floats differently (1e-05 vs 0.00001)
+        but parse to identical values.
+        """
+        if orjson is not None:
+            return self.to_json_bytes(pretty=pretty).decode("utf-8")
+        if pretty:
+            return json.dumps(self._to_json_dict(), indent=2, sort_keys=False)
+        return json.dumps(self._to_json_dict(), separators=(",", ":"))
+
+    def to_json_bytes(self, pretty: bool = True) -> bytes:
+        """
+        Serialize to UTF-8 JSON bytes with the same layout as to_json().
+
+        Uses orjson when installed, avoiding the intermediate str and the
+        re-encode on write.
+        """
+        if orjson is not None:
+            if pretty:
+                return orjson.dumps(self._to_json_dict(), option=orjson.OPT_INDENT_2)
+            return orjson.dumps(self._to_json_dict())
+        if pretty:
+            return json.dumps(self._to_json_dict(), indent=2, sort_keys=False).encode("utf-8")
+        return json.dumps(self._to_json_dict(), separators=(",", ":")).encode("utf-8")
+
+    def _to_json_dict(self) -> dict[str, Any]:
+        """Build the JSON-ready dict with stable key ordering."""
         data = {
             "relevance_semantics": self.relevance_semantics,
-            "aggregate_metrics": dict(sorted(self.aggregate_metrics.items())),
-            "macro_metrics": dict(sorted(self.macro_metrics.items())),
-            "per_query_metrics": dict(sorted(self.per_query_metrics.items())),
-            "per_slice_metrics": dict(sorted(self.per_slice_metrics.items())),
+            "aggregate_metrics": _sorted_by_key(self.aggregate_metrics),
+            "macro_metrics": _sorted_by_key(self.macro_metrics),
+            "per_query_metrics": _sorted_by_key(self.per_query_metrics),
+            "per_slice_metrics": _sorted_by_key(self.per_slice_metrics),
             "query_count": self.query_count,
             "k_values": self.config.k_values,
             "relevance_mode": self.config.relevance_mode,
@@ -107,43 +165,98 @@ class ScoreResult:
                 "pct_two_plus_positives": self.label_shape_stats.pct_two_plus_positives,
                 "total_queries": self.label_shape_stats.total_queries,
             }
-        return json.dumps(data, indent=2, sort_keys=False)
+        return data
+
+
+def _build_trec_qrels(dataset: BenchmarkDataset) -> dict[str, dict[str, int]]:
+    """Convert dataset qrels to pytrec_eval's query_id -> {doc_id: relevance} format."""
+    qrels: dict[str, dict[str, int]] = {}
+    get = qrels.get
+    for q in dataset.qrels:
+        docs = get(q.query_id)
+        if docs is None:
+            docs = qrels[q.query_id] = {}
+        docs[q.canonical_item_id] = q.relevance
+    return qrels
+
+
+def _build_trec_run(run: Run) -> dict[str, dict[str, float]]:
+    """Convert benchmark run to pytrec_eval's query_id -> {doc_id: score} format."""
+    # One pass with a bound .get; grouping through iter_by_query() first and
+    # then building per-query dicts measured about 2x slower
+    trec_run: dict[str, dict[str, float]] = {}
+    get = trec_run.get
+    for e in run.entries:
+        docs = get(e.query_id)
+        if docs is None:
+            docs = trec_run[e.query_id] = {}
+        docs[e.canonical_item_id] = e.score
+    return trec_run
+
+
+def _build_trec_measures(k_values: list[int], metrics: list[str]) -> dict[str, tuple[str, str]]:
+    """
+    Map pytrec_eval measure names to (ir_measures name, reported metric name).
 
+    Entries are in the order pytrec_eval reports them for each query, so
+    accumulators seeded from this table keep the metrics' first-seen order.
+    The ir_measures name is only used to order the zero rows of unretrieved
+    queries the way ir_measures.iter_calc did.
+    """
+    measures: dict[str, tuple[str, str]] = {}
+    # MRR has no cutoff (it's MRR, not MRR@K)
+    if "mrr" in metrics:
+        measures["recip_rank"] = ("RR", "mrr")
+
+    cutoffs = sorted(set(k_values))
+    if "precision" in metrics:
+        for k in cutoffs:
+            measures[f"P_{k}"] = (f"P@{k}", f"precision@{k}")
+    if "recall" in metrics:
+        for k in cutoffs:
+            measures[f"recall_{k}"] = (f"R@{k}", f"recall@{k}")
+    if "ndcg" in metrics:
+        for k in cutoffs:
+            measures[f"ndcg_cut_{k}"] = (f"nDCG@{k}", f"ndcg@{k}")
+    if "map" in metrics:
+        for k in cutoffs:
+            measures[f"map_cut_{k}"] = (f"AP@{k}", f"map@{k}")
 
-def _build_ir_measures_qrels(dataset: BenchmarkDataset) -> list[ir_measures.Qrel]:
-    """Convert dataset qrels to ir_measures format."""
-    return [
-        ir_measures.Qrel(query_id=q.query_id, doc_id=q.canonical_item_id, relevance=q.relevance)
-        for q in dataset.qrels
-    ]
+    return measures
 
 
-def _build_ir_measures_run(run: Run) -> list[ir_measures.ScoredDoc]:
-    """Convert benchmark run to ir_measures format."""
-    return [
-        ir_measures.ScoredDoc(query_id=e.query_id, doc_id=e.canonical_item_id, score=e.score)
-        for e in run.entries
-    ]
+def _relevance_evaluator(
+    qrels: dict[str, dict[str, int]], measures: dict[str, tuple[str, str]]
+) -> pytrec_eval.RelevanceEvaluator:
+    """Build a pytrec_eval evaluator with the settings ir_measures uses by default."""
+    return pytrec_eval.RelevanceEvaluator(qrels, list(measures), relevance_level=1)
 
 
-def _build_metrics_list(config: ScorerConfig) -> list:
-    """Build the list of ir_measures metrics to compute."""
-    measures = []
-    for k in config.k_values:
-        if "recall" in config.metrics:
-            measures.append(Recall @ k)
-        if "precision" in config.metrics:
-            measures.append(Precision @ k)
-        if "map" in config.metrics:
-            measures.append(AP @ k)
-        if "ndcg" in config.metrics:
-            measures.append(nDCG @ k)
+def _iter_metric_values(
+    evaluator: pytrec_eval.RelevanceEvaluator,
+    measures: dict[str, tuple[str, str]],
+    qrel_query_ids: Iterable[str],
+    run: dict[str, dict[str, float]],
+) -> Iterator[tuple[str, str, float]]:
+    """
+    Yield per-query (query_id, metric_name, value) rows for a run.
 
-    # MRR doesn't use @K in ir_measures (it's MRR, not MRR@K)
-    if "mrr" in config.metrics:
-        measures.append(RR)
+    Rows come in the same order as ir_measures.iter_calc: scored queries in
+    run order, then a 0.0 row per measure for each judged query the run
+    missed.
+    """
+    # Flat pytrec_eval name -> reported name table for the per-row lookup
+    metric_name_of = {measure: name for measure, (_, name) in measures.items()}
+    results = evaluator.evaluate(run)
+    for query_id, values in results.items():
+        for measure, value in values.items():
+            yield query_id, metric_name_of[measure], value
 
-    return measures
+    missing = sorted(set(qrel_query_ids) - results.keys())
+    if missing:
+        for _, metric_name in sorted(measures.values()):
+            for query_id in missing:
+                yield query_id, metric_name, 0.0
 
 
 def compute_metrics(
@@ -152,7 +265,7 @@ def compute_metrics(
     k_values: list[int] | None = None,
 ) -> dict[str, float]:
     """
-    Compute IR metrics using ir_measures.
+    Compute IR metrics using pytrec_eval.
 
     Args:
         qrels: Dict mapping query_id -> {doc_id: relevance}
@@ -165,50 +278,56 @@ def compute_metrics(
     if k_values is None:
         k_values = DEFAULT_K_VALUES
 
-    # Convert to ir_measures format
-    ir_qrels = [
-        ir_measures.Qrel(query_id=qid, doc_id=did, relevance=rel)
-        for qid, docs in qrels.items()
-        for did, rel in docs.items()
-    ]
-
-    ir_run = [
-        ir_measures.ScoredDoc(query_id=qid, doc_id=did, score=score)
-        for qid, docs in run.items()
-        for did, score in docs.items()
-    ]
-
-    # Build measures
-    measures = []
-    for k in k_values:
-        measures.extend([Recall @ k, Precision @ k, AP @ k, nDCG @ k])
-    measures.append(RR)
+    # pytrec_eval consumes the dict-of-dict inputs directly
+    measures = _build_trec_measures(k_values, ["recall", "precision", "map", "ndcg", "mrr"])
+    evaluator = _relevance_evaluator(qrels, measures)
 
     # Compute
     results = {}
-    for metric_result in ir_measures.iter_calc(measures, ir_qrels, ir_run):
-        metric_name = _normalize_metric_name_str(str(metric_result.measure).lower())
-        results[metric_name] = metric_result.value
+    for _, metric_name, value in _iter_metric_values(evaluator, measures, qrels, run):
+        results[metric_name] = value
 
     return results
 
 
-def _normalize_metric_name_str(name: str) -> str:
-    """Normalize metric name string to user-friendly form."""
-    if name == "rr":
-        return "mrr"
-    elif name.startswith("r@"):
-        return "recall@" + name[2:]
-    elif name.startswith("p@"):
-        return "precision@" + name[2:]
-    elif name.startswith("ap@"):
-        return "map@" + name[3:]
-    return name
+def _score_query_chunk(
+    config: ScorerConfig,
+    qrel_rows: list[tuple[str, str, int]],
+    run_rows: list[tuple[str, str, float]],
+) -> list[tuple[str, str, float]]:
+    """
+    Compute per-query metrics for one chunk of queries (process pool worker).
+
+    Takes and returns plain tuples so arguments and results pickle cheaply.
+    """
+    qrels: dict[str, dict[str, int]] = {}
+    for query_id, doc_id, relevance in qrel_rows:
+        qrels.setdefault(query_id, {})[doc_id] = relevance
+    run: dict[str, dict[str, float]] = {}
+    for query_id, doc_id, score in run_rows:
+        run.setdefault(query_id, {})[doc_id] = score
+    measures = _build_trec_measures(config.k_values, config.metrics)
+    return list(_iter_metric_values(_relevance_evaluator(qrels, measures), measures, qrels, run))
+
+
+# Scorer for the current process-pool worker, set by _init_run_worker
+_worker_scorer: BenchmarkScorer | None = None
+
+
+def _init_run_worker(dataset: BenchmarkDataset, config: ScorerConfig) -> None:
+    """Build the worker's scorer once, so the dataset is pickled once per worker."""
+    global _worker_scorer
+    _worker_scorer = BenchmarkScorer(dataset, config)
+
+
+def _score_trec_run_in_worker(trec_run: dict[str, dict[str, float]]) -> ScoreResult:
+    """Score one run with the worker's scorer (process pool worker)."""
+    return _worker_scorer._score_trec_run(trec_run)
 
 
 class BenchmarkScorer:
     """
-    Scores benchmark runs against a dataset using ir_measures.
+    Scores benchmark runs against a dataset using pytrec_eval.
 
     Usage:
         scorer = BenchmarkScorer(dataset, config)
@@ -219,18 +338,30 @@ class BenchmarkScorer:
     def __init__(self, dataset: BenchmarkDataset, config: ScorerConfig | None = None):
         self.dataset = dataset
         self.config = config or ScorerConfig()
-        self._qrels = _build_ir_measures_qrels(dataset)
+        # Qrels and the evaluator are built once and reused for every run
+        self._trec_qrels = _build_trec_qrels(dataset)
+        self._trec_measures = _build_trec_measures(self.config.k_values, self.config.metrics)
+        # Reported metric names in report order, and each name's accumulator index
+        self._metric_names = [name for _, name in self._trec_measures.values()]
+        self._metric_index = {name: i for i, name in enumerate(self._metric_names)}
+        self._evaluator = _relevance_evaluator(self._trec_qrels, self._trec_measures)
+        # Qrels per query (used for weighting and label shape); Counter counts in C
+        self._qrel_counts: Counter[str] = Counter(q.query_id for q in dataset.qrels)
         self._topic_slices = self._build_topic_slice_map()
+        # Depends only on the dataset; computed on the first score_run
+        self._label_shape_stats: LabelShapeStats | None = None
+        # run_id -> (entries list, entry count, result); see config.result_cache_size
+        self._result_cache: OrderedDict[str, tuple[list[RunEntry], int, ScoreResult]] = OrderedDict()
 
-    def _build_topic_slice_map(self) -> dict[str, list[str]]:
+    def _build_topic_slice_map(self) -> dict[str, Sequence[str]]:
         """
-        Map query_id -> list of slice names.
+        Map query_id -> slice names.
         
         Plan 113 code review fix: Support multi-slice queries by returning
         all slice_ids for each query, not just the first one.
         """
         return {
-            t.query_id: t.slice_ids if t.slice_ids else ["default"]
+            t.query_id: t.slice_ids if t.slice_ids else _DEFAULT_SLICES
             for t in self.dataset.topics
         }
 
@@ -243,79 +374,110 @@ class BenchmarkScorer:
         Plan 113 code review fix:
         - aggregate_metrics: Weighted by qrel count (hub queries have more influence)
         - macro_metrics: Per-query equal weighting (each query counts the same)
+
+        With config.result_cache_size > 0, re-scoring a run with the same
+        run_id, the same entries list and the same entry count returns the
+        cached (shared) ScoreResult. Replacing run.entries or changing its
+        length invalidates the entry; edits to entries in place do not.
         """
-        # Plan 113 M2: Always compute label shape stats (from dataset, not run)
-        label_shape_stats = self._compute_label_shape_stats()
-        
-        if not run.entries:
-            return ScoreResult(
-                aggregate_metrics={},
-                per_query_metrics={},
-                per_slice_metrics={},
-                query_count=0,
-                config=self.config,
-                relevance_semantics="filtered",
-                label_shape_stats=label_shape_stats,
-                macro_metrics={},
-            )
+        cache_size = self.config.result_cache_size
+        if cache_size > 0:
+            cached = self._result_cache.get(run.run_id)
+            if cached is not None and cached[0] is run.entries and cached[1] == len(run.entries):
+                self._result_cache.move_to_end(run.run_id)
+                return cached[2]
+
+        if self.config.n_workers > 1 and run.entries:
+            result = self._score_metric_values(self._score_queries_parallel(run))
+        else:
+            result = self._score_trec_run(_build_trec_run(run))
+
+        if cache_size > 0:
+            self._result_cache[run.run_id] = (run.entries, len(run.entries), result)
+            self._result_cache.move_to_end(run.run_id)
+            while len(self._result_cache) > cache_size:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _score_trec_run(self, trec_run: dict[str, dict[str, float]]) -> ScoreResult:
+        """Score a run given in pytrec_eval's query_id -> {doc_id: score} format."""
+        if not trec_run:
+            # Empty run: no metrics, but label shape stats are still reported
+            return self._score_metric_values(())
+        return self._score_metric_values(
+            _iter_metric_values(self._evaluator, self._trec_measures, self._trec_qrels, trec_run)
+        )
 
-        ir_run = _build_ir_measures_run(run)
-        measures = _build_metrics_list(self.config)
+    def _score_metric_values(self, metric_values: Iterable[tuple[str, str, float]]) -> ScoreResult:
+        """Aggregate per-query (query_id, metric_name, value) rows into a ScoreResult."""
+        # Plan 113 M2: Always compute label shape stats (from dataset, not run)
+        if self._label_shape_stats is None:
+            self._label_shape_stats = self._compute_label_shape_stats()
+        # Each result gets its own copy so callers can't alter later results
+        label_shape_stats = replace(self._label_shape_stats)
 
-        # Get qrel counts per query for weighting
-        qrels_by_query = self.dataset.qrels_by_query()
-        
         # Compute per-query metrics
         per_query: dict[str, dict[str, float]] = {}
+        # Rows are also collected into flat columns (query index, metric
+        # index, value) and reduced with np.bincount below
+        metric_names = self._metric_names
+        metric_index = self._metric_index
+        query_index: dict[str, int] = {}
+        row_queries: list[int] = []
+        row_metrics: list[int] = []
+        row_values: list[float] = []
+
+        # pytrec_eval reports each query's measures together, so the query
+        # lookups only run when the query changes from the previous row
+        last_query_id = None
+        for query_id, metric_name, value in metric_values:
+            if query_id != last_query_id:
+                last_query_id = query_id
+                q = query_index.get(query_id)
+                if q is None:
+                    q = query_index[query_id] = len(query_index)
+                    per_query[query_id] = {}
+                query_metrics = per_query[query_id]
+            query_metrics[metric_name] = value
+
+            row_queries.append(q)
+            row_metrics.append(metric_index[metric_name])
+            row_values.append(value)
+
+        # bincount adds each bin's rows in row order, in float64, so the
+        # sums match a sequential Python accumulation exactly
+        n_metrics = len(metric_names)
+        queries = np.array(row_queries, dtype=np.intp)
+        codes = np.array(row_metrics, dtype=np.intp)
+        values = np.array(row_values, dtype=np.float64)
+        # Weight per query (number of qrels). Judged queries have a count
+        # >= 1, so unjudged queries default straight to the minimum of 1
+        weight_of = self._qrel_counts.get
+        query_weights = np.array([weight_of(query_id, 1) for query_id in per_query], dtype=np.float64)
+        weights = query_weights[queries]
         # For macro: simple sum and count
-        macro_sums: dict[str, float] = {}
-        macro_counts: dict[str, int] = {}
+        macro_sums = np.bincount(codes, weights=values, minlength=n_metrics)
+        macro_counts = np.bincount(codes, minlength=n_metrics)
         # For aggregate: weighted by qrel count
-        weighted_sums: dict[str, float] = {}
-        weight_totals: dict[str, float] = {}
-
-        for result in ir_measures.iter_calc(measures, self._qrels, ir_run):
-            query_id = result.query_id
-            metric_name = self._normalize_metric_name(result.measure)
-
-            if query_id not in per_query:
-                per_query[query_id] = {}
-            per_query[query_id][metric_name] = result.value
-            
-            # Get weight for this query (number of qrels)
-            query_qrel_count = len(qrels_by_query.get(query_id, []))
-            weight = max(query_qrel_count, 1)  # Minimum weight of 1
-
-            # Accumulate for macro (unweighted)
-            if metric_name not in macro_sums:
-                macro_sums[metric_name] = 0.0
-                macro_counts[metric_name] = 0
-            macro_sums[metric_name] += result.value
-            macro_counts[metric_name] += 1
-            
-            # Accumulate for aggregate (weighted by qrel count)
-            if metric_name not in weighted_sums:
-                weighted_sums[metric_name] = 0.0
-                weight_totals[metric_name] = 0.0
-            weighted_sums[metric_name] += result.value * weight
-            weight_totals[metric_name] += weight
+        weighted_sums = np.bincount(codes, weights=values * weights, minlength=n_metrics)
+        weight_totals = np.bincount(codes, weights=weights, minlength=n_metrics)
 
         # Compute aggregate (qrel-weighted mean)
         aggregate_metrics = {
-            name: weighted_sums[name] / weight_totals[name]
-            for name in weighted_sums
-            if weight_totals[name] > 0
+            name: float(weighted_sums[i] / weight_totals[i])
+            for i, name in enumerate(metric_names)
+            if weight_totals[i] > 0
         }
         
         # Compute macro (simple mean over queries)
         macro_metrics = {
-            name: macro_sums[name] / macro_counts[name]
-            for name in macro_sums
-            if macro_counts[name] > 0
+            name: float(macro_sums[i] / macro_counts[i])
+            for i, name in enumerate(metric_names)
+            if macro_counts[i] > 0
         }
 
         # Compute per-slice metrics (with query counts per Plan 113)
-        per_slice = self._compute_per_slice_metrics(per_query)
+        per_slice = self._compute_per_slice_metrics(list(per_query), queries, codes, values)
 
         return ScoreResult(
             aggregate_metrics=aggregate_metrics,
@@ -328,65 +490,150 @@ class BenchmarkScorer:
             macro_metrics=macro_metrics,
         )
 
-    def _normalize_metric_name(self, measure) -> str:
-        """Convert ir_measures measure to our naming convention."""
-        name = str(measure).lower()
-        # Normalize to full names for clarity
-        if name == "rr":
-            return "mrr"
-        elif name.startswith("r@"):
-            return "recall@" + name[2:]
-        elif name.startswith("p@"):
-            return "precision@" + name[2:]
-        elif name.startswith("ap@"):
-            return "map@" + name[3:]
-        elif name.startswith("ndcg@"):
-            return name  # Already good
-        return name
+    def score_runs(self, runs: list[Run], n_workers: int | None = None) -> list[ScoreResult]:
+        """
+        Score several runs against the dataset, e.g. the runs of a tuning sweep.
+
+        Runs are independent, so with n_workers > 1 they are scored in that
+        many processes, each holding its own scorer. Defaults to
+        config.n_workers. Results are returned in the order of `runs`.
+
+        Runs are sent to workers as pytrec_eval dicts, which pickle several
+        times faster than lists of RunEntry objects.
+        """
+        n_workers = self.config.n_workers if n_workers is None else n_workers
+        if n_workers <= 1 or len(runs) <= 1:
+            return [self.score_run(run) for run in runs]
+
+        # Imported here: concurrent.futures.process adds ~20ms to CLI cold start
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Parallelism is across runs; each worker scores its runs in-process
+        worker_config = replace(self.config, n_workers=1)
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(runs)),
+            initializer=_init_run_worker,
+            initargs=(self.dataset, worker_config),
+        ) as executor:
+            results = list(executor.map(_score_trec_run_in_worker, map(_build_trec_run, runs)))
+        for result in results:
+            result.config = self.config
+        return results
+
+    def _score_queries_parallel(self, run: Run) -> list[tuple[str, str, float]]:
+        """
+        Score queries across config.n_workers processes.
+
+        Queries are independent, so the run and qrels are partitioned by
+        query_id into one chunk per worker and scored with the same measures.
+        """
+        n_workers = self.config.n_workers
+        # Queries judged in qrels but missing from the run still score (as 0),
+        # so chunks cover the union of both query sets.
+        query_ids = sorted(
+            {e.query_id for e in run.entries} | {q.query_id for q in self.dataset.qrels}
+        )
+        chunk_of = {qid: i % n_workers for i, qid in enumerate(query_ids)}
+
+        run_chunks: list[list[tuple[str, str, float]]] = [[] for _ in range(n_workers)]
+        for e in run.entries:
+            run_chunks[chunk_of[e.query_id]].append((e.query_id, e.canonical_item_id, e.score))
+
+        qrel_chunks: list[list[tuple[str, str, int]]] = [[] for _ in range(n_workers)]
+        for q in self.dataset.qrels:
+            qrel_chunks[chunk_of[q.query_id]].append((q.query_id, q.canonical_item_id, q.relevance))
+
+        # Imported here: concurrent.futures.process adds ~20ms to CLI cold start
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each query's rows come back contiguous from exactly one worker
+        rows_of: dict[str, list[tuple[str, str, float]]] = {}
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(_score_query_chunk, self.config, qrel_rows, run_rows)
+                for qrel_rows, run_rows in zip(qrel_chunks, run_chunks)
+                if qrel_rows
+            ]
+            for future in futures:
+                for row in future.result():
+                    query_rows = rows_of.get(row[0])
+                    if query_rows is None:
+                        query_rows = rows_of[row[0]] = []
+                    query_rows.append(row)
+
+        # Restore the in-process row order (see _iter_metric_values), so the
+        # result, including float sums, does not depend on n_workers: judged
+        # queries in run order, then each measure's 0.0 rows for the judged
+        # queries the run missed, sorted by query_id
+        run_query_ids = dict.fromkeys(e.query_id for e in run.entries)
+        metric_values: list[tuple[str, str, float]] = []
+        for query_id in run_query_ids:
+            if query_id in self._trec_qrels:
+                metric_values.extend(rows_of[query_id])
+        missing = sorted(self._trec_qrels.keys() - run_query_ids.keys())
+        for j in range(len(self._trec_measures)):
+            metric_values.extend(rows_of[query_id][j] for query_id in missing)
+        return metric_values
 
     def _compute_per_slice_metrics(
-        self, per_query: dict[str, dict[str, float]]
+        self,
+        query_ids: list[str],
+        queries: np.ndarray,
+        codes: np.ndarray,
+        values: np.ndarray,
     ) -> dict[str, dict[str, Any]]:
         """
         Aggregate metrics by slice.
         
+        Takes the per-query rows as flat columns: `queries` indexes into
+        `query_ids`, `codes` into the scorer's metric names.
+
         Plan 113 M3: Now includes query_count per slice for hub dominance visibility.
         Plan 113 code review fix: Multi-slice queries count toward ALL their slices.
         """
-        slice_sums: dict[str, dict[str, float]] = {}
-        slice_counts: dict[str, dict[str, int]] = {}
-        slice_query_counts: dict[str, int] = {}
-
-        for query_id, metrics in per_query.items():
-            # Get all slices this query belongs to
-            slice_names = self._topic_slices.get(query_id, ["default"])
-            
+        metric_names = self._metric_names
+        n_metrics = len(metric_names)
+
+        # Query x metric value matrix; `reported` marks the cells that had a row
+        matrix = np.zeros((len(query_ids), n_metrics))
+        reported = np.zeros((len(query_ids), n_metrics))
+        matrix[queries, codes] = values
+        reported[queries, codes] = 1.0
+
+        # One (slice, query) pair per slice membership, in query order, with
+        # slices numbered in first-seen order
+        slice_index: dict[str, int] = {}
+        pair_slices: list[int] = []
+        pair_queries: list[int] = []
+        for q, query_id in enumerate(query_ids):
             # Count this query's metrics in EACH of its slices
-            for slice_name in slice_names:
-                if slice_name not in slice_sums:
-                    slice_sums[slice_name] = {}
-                    slice_counts[slice_name] = {}
-                    slice_query_counts[slice_name] = 0
-                
-                slice_query_counts[slice_name] += 1
-
-                for metric_name, value in metrics.items():
-                    if metric_name not in slice_sums[slice_name]:
-                        slice_sums[slice_name][metric_name] = 0.0
-                        slice_counts[slice_name][metric_name] = 0
-                    slice_sums[slice_name][metric_name] += value
-                    slice_counts[slice_name][metric_name] += 1
+            for slice_name in self._topic_slices.get(query_id, _DEFAULT_SLICES):
+                s = slice_index.get(slice_name)
+                if s is None:
+                    s = slice_index[slice_name] = len(slice_index)
+                pair_slices.append(s)
+                pair_queries.append(q)
+
+        # Per-(slice, metric) sums; bincount adds in query order, like the
+        # sequential per-query accumulation
+        n_bins = len(slice_index) * n_metrics
+        slice_codes = np.array(pair_slices, dtype=np.intp)
+        bins = (slice_codes[:, None] * n_metrics + np.arange(n_metrics)).ravel()
+        slice_sums = np.bincount(bins, weights=matrix[pair_queries].ravel(), minlength=n_bins)
+        slice_counts = np.bincount(bins, weights=reported[pair_queries].ravel(), minlength=n_bins)
+        slice_query_counts = np.bincount(slice_codes, minlength=len(slice_index))
 
         # Average and include query_count
         per_slice: dict[str, dict[str, Any]] = {}
-        for slice_name, sums in slice_sums.items():
+        for slice_name, s in slice_index.items():
+            base = s * n_metrics
             per_slice[slice_name] = {
-                metric: sums[metric] / slice_counts[slice_name][metric]
-                for metric in sums
-                if slice_counts[slice_name][metric] > 0
+                metric: float(slice_sums[base + j] / slice_counts[base + j])
+                for j, metric in enumerate(metric_names)
+                if slice_counts[base + j] > 0
             }
             # Plan 113 M3: Add query_count for slice membership visibility
-            per_slice[slice_name]["query_count"] = slice_query_counts[slice_name]
+            per_slice[slice_name]["query_count"] = int(slice_query_counts[s])
 
         return per_slice
 
@@ -396,18 +643,14 @@ class BenchmarkScorer:
         
         Returns stats on label shape to prevent misleading benchmarks.
         """
-        import statistics
-        
-        # Count positives per query from qrels
-        qrels_by_query = self.dataset.qrels_by_query()
-        
-        # Include all topics, even those with 0 qrels
-        positives_per_query = []
-        for topic in self.dataset.topics:
-            qrels_for_query = qrels_by_query.get(topic.query_id, [])
-            positives_per_query.append(len(qrels_for_query))
+        # Positives per query from qrels, including topics with 0 qrels
+        qrel_counts = self._qrel_counts
+        topics = self.dataset.topics
+        positives_per_query = np.fromiter(
+            (qrel_counts[topic.query_id] for topic in topics), dtype=np.int64, count=len(topics)
+        )
         
-        if not positives_per_query:
+        if not positives_per_query.size:
             # Empty dataset edge case
             return LabelShapeStats(
                 min=0, max=0, mean=0.0, median=0.0, p95=0.0,
@@ -415,27 +658,26 @@ class BenchmarkScorer:
                 pct_two_plus_positives=0.0, total_queries=0
             )
         
-        sorted_counts = sorted(positives_per_query)
-        n = len(sorted_counts)
+        n = positives_per_query.size
         
-        # Distribution percentages
-        zero_count = sum(1 for c in positives_per_query if c == 0)
-        one_count = sum(1 for c in positives_per_query if c == 1)
-        two_plus_count = sum(1 for c in positives_per_query if c >= 2)
+        # Distribution percentages: one bincount over counts capped at 2
+        zero_count, one_count, two_plus_count = np.bincount(
+            np.minimum(positives_per_query, 2), minlength=3
+        )
         
-        # P95 calculation
+        # P95 calculation (nearest-rank below, as an index into the sorted counts)
         p95_idx = int(0.95 * (n - 1))
-        p95 = float(sorted_counts[p95_idx])
+        p95 = float(np.partition(positives_per_query, p95_idx)[p95_idx])
         
         return LabelShapeStats(
-            min=sorted_counts[0],
-            max=sorted_counts[-1],
-            mean=statistics.mean(positives_per_query),
-            median=float(statistics.median(positives_per_query)),
+            min=int(positives_per_query.min()),
+            max=int(positives_per_query.max()),
+            mean=float(positives_per_query.mean()),
+            median=float(np.median(positives_per_query)),
             p95=p95,
-            pct_zero_positives=(zero_count / n) * 100,
-            pct_one_positive=(one_count / n) * 100,
-            pct_two_plus_positives=(two_plus_count / n) * 100,
+            pct_zero_positives=(int(zero_count) / n) * 100,
+            pct_one_positive=(int(one_count) / n) * 100,
+            pct_two_plus_positives=(int(two_plus_count) / n) * 100,
             total_queries=n,
         )
 
@@ -538,9 +780,10 @@ def format_results_markdown(result: ScoreResult) -> str:
     ])
 
     # Sort metrics for consistent output
-    for metric, value in sorted(result.aggregate_metrics.items()):
-        display_name = metric.replace("@", "@").title()
-        lines.append(f"| {display_name} | {value:.4f} |")
+    lines.extend(
+        f"| {metric.title()} | {value:.4f} |"
+        for metric, value in sorted(result.aggregate_metrics.items())
+    )
 
     # Plan 113 M3: Macro Metrics (explicit section)
     if result.macro_metrics:
@@ -553,9 +796,10 @@ def format_results_markdown(result: ScoreResult) -> str:
             "| Metric | Value |",
             "|--------|-------|",
         ])
-        for metric, value in sorted(result.macro_metrics.items()):
-            display_name = metric.replace("@", "@").title()
-            lines.append(f"| {display_name} | {value:.4f} |")
+        lines.extend(
+            f"| {metric.title()} | {value:.4f} |"
+            for metric, value in sorted(result.macro_metrics.items())
+        )
 
     if result.per_slice_metrics:
         lines.extend(
@@ -582,8 +826,8 @@ def format_results_markdown(result: ScoreResult) -> str:
             slice_metrics = result.per_slice_metrics[slice_name]
             query_count = slice_metrics.get("query_count", "N/A")
             values = [
-                f"{slice_metrics.get(m, 0.0):.4f}" if isinstance(slice_metrics.get(m, 0.0), float) else str(slice_metrics.get(m, 0.0))
-                for m in sorted_metrics
+                f"{value:.4f}" if isinstance(value, float) else str(value)
+                for value in (slice_metrics.get(m, 0.0) for m in sorted_metrics)
             ]
             lines.append(f"| {slice_name} | {query_count} | " + " | ".join(values) + " |")
 
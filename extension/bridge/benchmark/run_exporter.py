@@ -7,6 +7,7 @@ Separates "produce a run" from "score a run" for deterministic CI.
 
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
 from benchmark.benchmark_contract import (
@@ -34,6 +35,8 @@ class RetrievalResultAdapter:
     Follows Step 0 ID rules: topic_id → uuid5(topic) → None (never summary_text).
     """
 
+    __slots__ = ("_result", "_is_dict")
+
     def __init__(self, result: Any):
         """
         Initialize adapter with a retrieval result.
@@ -72,6 +75,10 @@ class RetrievalResultAdapter:
         return self._get_field("metadata")
 
 
+# Metadata source substrings that mark LLM-augmented results
+_LLM_SOURCE_MARKERS = ("llm", "completion")
+
+
 def filter_benchmark_mode_results(results: List[Any]) -> List[Any]:
     """
     Filter results to exclude LLM-generated content for benchmark mode.
@@ -87,13 +94,17 @@ def filter_benchmark_mode_results(results: List[Any]) -> List[Any]:
     """
     filtered = []
     for result in results:
-        adapter = RetrievalResultAdapter(result)
-        metadata = adapter.get_metadata()
+        # Same lookup as RetrievalResultAdapter.get_metadata(), without
+        # building an adapter per result
+        if isinstance(result, dict):
+            metadata = result.get("metadata")
+        else:
+            metadata = getattr(result, "metadata", None)
 
         # Check for LLM completion markers in metadata
         if metadata:
-            source = metadata.get("source", "")
-            if "llm" in source.lower() or "completion" in source.lower():
+            source = metadata.get("source", "").lower()
+            if any(marker in source for marker in _LLM_SOURCE_MARKERS):
                 continue
 
         filtered.append(result)
@@ -101,6 +112,10 @@ def filter_benchmark_mode_results(results: List[Any]) -> List[Any]:
     return filtered
 
 
+# Sort key for (canonical_id, score) pairs
+_score_key = itemgetter(1)
+
+
 def export_retrieval_results_to_run(
     results: Dict[str, List[Any]],
     run_id: str,
@@ -135,18 +150,14 @@ def export_retrieval_results_to_run(
             if canonical_id is not None:
                 adapted.append((canonical_id, adapter.get_score()))
 
-        # Sort by score descending
-        adapted.sort(key=lambda x: x[1], reverse=True)
-
-        # Create ranked entries
-        for rank, (canonical_id, score) in enumerate(adapted, start=1):
-            entries.append(
-                RunEntry(
-                    query_id=query_id,
-                    canonical_item_id=canonical_id,
-                    rank=rank,
-                    score=score,
-                )
-            )
+        # Sort by score descending (stable, so ties keep retrieval order)
+        adapted.sort(key=_score_key, reverse=True)
+
+        # Create ranked entries; positional args in RunEntry field order
+        # (query_id, canonical_item_id, rank, score) skip keyword matching
+        entries.extend([
+            RunEntry(query_id, canonical_id, rank, score)
+            for rank, (canonical_id, score) in enumerate(adapted, start=1)
+        ])
 
     return Run(run_id=run_id, entries=entries)
@@ -8,25 +8,66 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 # TDD Red Phase: Import the module we're about to create
 from benchmark.benchmark_cli import (
     BenchmarkCLI,
     load_dataset_from_dir,
-    score_run_file,
     main,
+    score_run_file,
 )
 from benchmark.benchmark_contract import (
-    Topic,
+    BenchmarkDataset,
     Qrel,
     Run,
     RunEntry,
-    BenchmarkDataset,
+    Topic,
+    save_qrels,
     save_run,
     save_topics,
-    save_qrels,
+    write_json,
 )
+from benchmark.benchmark_scorer import BenchmarkScorer
+
+# Read-only minimal dataset (1 topic, 1 qrel) shared by the tests in this
+# module; tests write runs and outputs to their own tempdirs.
+_minimal_dataset_tmpdir = None
+MINIMAL_DATASET_DIR = None
+
+
+def setUpModule():
+    """Write the shared minimal dataset once for the whole module."""
+    global _minimal_dataset_tmpdir, MINIMAL_DATASET_DIR
+    _minimal_dataset_tmpdir = tempfile.TemporaryDirectory()
+    MINIMAL_DATASET_DIR = Path(_minimal_dataset_tmpdir.name)
+
+    topics = [Topic(query_id="q1", query_text="Test", slice_ids=["general"])]
+    qrels = [Qrel(query_id="q1", canonical_item_id="doc1", relevance=1)]
+    save_topics(topics, MINIMAL_DATASET_DIR / "topics.json")
+    save_qrels(qrels, MINIMAL_DATASET_DIR / "qrels.json")
+    metadata = {
+        "dataset_id": "test-dataset",
+        "version": "1.0",
+        "slice_definitions": {"general": "General queries"},
+    }
+    write_json(metadata, MINIMAL_DATASET_DIR / "metadata.json")
+
+
+def tearDownModule():
+    """Remove the shared minimal dataset."""
+    _minimal_dataset_tmpdir.cleanup()
+
+
+def _read_dataset_files(path: Path) -> dict:
+    """Snapshot a dataset directory's files as {name: bytes}."""
+    return {p.name: p.read_bytes() for p in path.iterdir()}
+
+
+def _write_dataset_files(path: Path, files: dict) -> None:
+    """Recreate a dataset directory from a _read_dataset_files snapshot."""
+    for name, data in files.items():
+        (path / name).write_bytes(data)
 
 
 class TestLoadDatasetFromDir(unittest.TestCase):
@@ -34,32 +75,37 @@ class TestLoadDatasetFromDir(unittest.TestCase):
 
     def test_load_dataset_reads_topics_and_qrels(self):
         """load_dataset_from_dir should read topics.json and qrels.json."""
+        dataset = load_dataset_from_dir(MINIMAL_DATASET_DIR)
+        self.assertEqual(dataset.dataset_id, "test-dataset")
+        self.assertEqual(len(dataset.topics), 1)
+        self.assertEqual(len(dataset.qrels), 1)
+
+    def test_load_dataset_reuses_parse_until_files_change(self):
+        """Unchanged dataset files are parsed once; edits invalidate the cache."""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
+            save_topics(
+                [Topic(query_id="q1", query_text="Test", slice_ids=["general"])],
+                tmppath / "topics.json",
+            )
+            save_qrels(
+                [Qrel(query_id="q1", canonical_item_id="doc1", relevance=1)],
+                tmppath / "qrels.json",
+            )
 
-            # Create minimal dataset files
-            topics = [
-                Topic(query_id="q1", query_text="Test query", slice_ids=["general"])
-            ]
-            qrels = [Qrel(query_id="q1", canonical_item_id="doc1", relevance=1)]
-
-            save_topics(topics, tmppath / "topics.json")
-            save_qrels(qrels, tmppath / "qrels.json")
-
-            # Create metadata file
-            metadata = {
-                "dataset_id": "test-dataset",
-                "version": "1.0",
-                "slice_definitions": {"general": "General queries"},
-            }
-            with open(tmppath / "metadata.json", "w") as f:
-                json.dump(metadata, f)
+            first = load_dataset_from_dir(tmppath)
+            self.assertIs(load_dataset_from_dir(tmppath), first)
 
-            # Load and verify
-            dataset = load_dataset_from_dir(tmppath)
-            self.assertEqual(dataset.dataset_id, "test-dataset")
-            self.assertEqual(len(dataset.topics), 1)
-            self.assertEqual(len(dataset.qrels), 1)
+            save_qrels(
+                [
+                    Qrel(query_id="q1", canonical_item_id="doc1", relevance=1),
+                    Qrel(query_id="q1", canonical_item_id="doc2", relevance=1),
+                ],
+                tmppath / "qrels.json",
+            )
+            reloaded = load_dataset_from_dir(tmppath)
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(len(reloaded.qrels), 2)
 
     def test_load_dataset_raises_on_missing_topics(self):
         """load_dataset_from_dir should raise if topics.json missing."""
@@ -127,23 +173,48 @@ class TestScoreRunFile(unittest.TestCase):
             self.assertIn("recall@5", result.aggregate_metrics)
 
 
+class TestScoreRunFileJsonl(unittest.TestCase):
+    """JSON Lines run files score the same as JSON run files."""
+
+    def test_jsonl_and_json_runs_score_identically(self):
+        from benchmark.benchmark_contract import save_run_jsonl
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            dataset = BenchmarkDataset(
+                dataset_id="test",
+                version="1.0",
+                topics=[Topic(query_id="q1", query_text="Test", slice_ids=["general"])],
+                qrels=[Qrel(query_id="q1", canonical_item_id="doc1", relevance=1)],
+                slice_definitions={"general": "General"},
+            )
+            run = Run(
+                run_id="test-run",
+                entries=[
+                    RunEntry(query_id="q1", canonical_item_id="doc2", rank=1, score=0.9),
+                    RunEntry(query_id="q1", canonical_item_id="doc1", rank=2, score=0.8),
+                ],
+            )
+            save_run(run, tmppath / "run.json")
+            save_run_jsonl(run, tmppath / "run.jsonl")
+
+            from_json = score_run_file(tmppath / "run.json", dataset)
+            from_jsonl = score_run_file(tmppath / "run.jsonl", dataset)
+            self.assertEqual(from_jsonl.aggregate_metrics, from_json.aggregate_metrics)
+
+
 class TestBenchmarkCLI(unittest.TestCase):
     """Tests for the BenchmarkCLI class."""
 
     def test_cli_initializes_with_dataset_path(self):
         """CLI should initialize with a dataset path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-            self._create_minimal_dataset(tmppath)
-
-            cli = BenchmarkCLI(dataset_path=tmppath)
-            self.assertEqual(cli.dataset.dataset_id, "test-dataset")
+        cli = BenchmarkCLI(dataset_path=MINIMAL_DATASET_DIR)
+        self.assertEqual(cli.dataset.dataset_id, "test-dataset")
 
     def test_cli_score_command_outputs_results(self):
         """CLI score command should output results to specified path."""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
-            self._create_minimal_dataset(tmppath)
 
             # Create a run file
             run = Run(
@@ -161,7 +232,7 @@ class TestBenchmarkCLI(unittest.TestCase):
             save_run(run, run_path)
 
             # Run CLI
-            cli = BenchmarkCLI(dataset_path=tmppath)
+            cli = BenchmarkCLI(dataset_path=MINIMAL_DATASET_DIR)
             output_path = tmppath / "results.json"
             cli.score(run_path, output_path)
 
@@ -175,7 +246,6 @@ class TestBenchmarkCLI(unittest.TestCase):
         """CLI should generate markdown summary."""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
-            self._create_minimal_dataset(tmppath)
 
             run = Run(
                 run_id="test-run",
@@ -191,7 +261,7 @@ class TestBenchmarkCLI(unittest.TestCase):
             run_path = tmppath / "run.json"
             save_run(run, run_path)
 
-            cli = BenchmarkCLI(dataset_path=tmppath)
+            cli = BenchmarkCLI(dataset_path=MINIMAL_DATASET_DIR)
             md_path = tmppath / "results.md"
             cli.score(run_path, output_path=tmppath / "results.json", markdown_path=md_path)
 
@@ -203,7 +273,6 @@ class TestBenchmarkCLI(unittest.TestCase):
         """CLI should save run summary with provenance."""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
-            self._create_minimal_dataset(tmppath)
 
             run = Run(
                 run_id="test-run",
@@ -219,7 +288,7 @@ class TestBenchmarkCLI(unittest.TestCase):
             run_path = tmppath / "run.json"
             save_run(run, run_path)
 
-            cli = BenchmarkCLI(dataset_path=tmppath)
+            cli = BenchmarkCLI(dataset_path=MINIMAL_DATASET_DIR)
             summary_path = tmppath / "summary.json"
             cli.score(run_path, output_path=tmppath / "results.json", summary_path=summary_path)
 
@@ -229,22 +298,6 @@ class TestBenchmarkCLI(unittest.TestCase):
             self.assertEqual(summary["run_id"], "test-run")
             self.assertEqual(summary["dataset_id"], "test-dataset")
 
-    def _create_minimal_dataset(self, path: Path):
-        """Helper to create a minimal dataset directory."""
-        topics = [Topic(query_id="q1", query_text="Test", slice_ids=["general"])]
-        qrels = [Qrel(query_id="q1", canonical_item_id="doc1", relevance=1)]
-
-        save_topics(topics, path / "topics.json")
-        save_qrels(qrels, path / "qrels.json")
-
-        metadata = {
-            "dataset_id": "test-dataset",
-            "version": "1.0",
-            "slice_definitions": {"general": "General queries"},
-        }
-        with open(path / "metadata.json", "w") as f:
-            json.dump(metadata, f)
-
 
 class TestMainEntrypoint(unittest.TestCase):
     """Tests for the main() CLI entrypoint."""
@@ -254,19 +307,6 @@ class TestMainEntrypoint(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
 
-            # Create dataset
-            topics = [Topic(query_id="q1", query_text="Test", slice_ids=["general"])]
-            qrels = [Qrel(query_id="q1", canonical_item_id="doc1", relevance=1)]
-            save_topics(topics, tmppath / "topics.json")
-            save_qrels(qrels, tmppath / "qrels.json")
-            metadata = {
-                "dataset_id": "test",
-                "version": "1.0",
-                "slice_definitions": {"general": "General"},
-            }
-            with open(tmppath / "metadata.json", "w") as f:
-                json.dump(metadata, f)
-
             # Create run
             run = Run(
                 run_id="test",
@@ -282,7 +322,7 @@ class TestMainEntrypoint(unittest.TestCase):
             # Call main with args
             exit_code = main([
                 "score",
-                "--dataset", str(tmppath),
+                "--dataset", str(MINIMAL_DATASET_DIR),
                 "--run", str(run_path),
                 "--output", str(output_path),
             ])
@@ -305,27 +345,42 @@ class TestCLISplitDiscipline(unittest.TestCase):
     - CLI records split provenance in run summary
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Serialize the split dataset and q3 run once; tests copy the bytes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            topics = [
+                Topic(query_id="q1", query_text="Train query", slice_ids=["general"], split="train"),
+                Topic(query_id="q2", query_text="Val query", slice_ids=["general"], split="validation"),
+                Topic(query_id="q3", query_text="Test query", slice_ids=["general"], split="test"),
+            ]
+            qrels = [
+                Qrel(query_id="q1", canonical_item_id="doc1", relevance=1),
+                Qrel(query_id="q2", canonical_item_id="doc2", relevance=1),
+                Qrel(query_id="q3", canonical_item_id="doc3", relevance=1),
+            ]
+            save_topics(topics, path / "topics.json")
+            save_qrels(qrels, path / "qrels.json")
+            metadata = {
+                "dataset_id": "test-splits",
+                "version": "1.0",
+                "slice_definitions": {"general": "General"},
+            }
+            write_json(metadata, path / "metadata.json")
+            cls._dataset_files = _read_dataset_files(path)
+
+            # Single-entry run on the test split, used by most tests
+            run = Run(
+                run_id="test",
+                entries=[RunEntry(query_id="q3", canonical_item_id="doc3", rank=1, score=0.9)],
+            )
+            save_run(run, path / "run.json")
+            cls._run_q3_bytes = (path / "run.json").read_bytes()
+
     def _create_dataset_with_splits(self, path: Path):
         """Helper to create dataset with split assignments."""
-        topics = [
-            Topic(query_id="q1", query_text="Train query", slice_ids=["general"], split="train"),
-            Topic(query_id="q2", query_text="Val query", slice_ids=["general"], split="validation"),
-            Topic(query_id="q3", query_text="Test query", slice_ids=["general"], split="test"),
-        ]
-        qrels = [
-            Qrel(query_id="q1", canonical_item_id="doc1", relevance=1),
-            Qrel(query_id="q2", canonical_item_id="doc2", relevance=1),
-            Qrel(query_id="q3", canonical_item_id="doc3", relevance=1),
-        ]
-        save_topics(topics, path / "topics.json")
-        save_qrels(qrels, path / "qrels.json")
-        metadata = {
-            "dataset_id": "test-splits",
-            "version": "1.0",
-            "slice_definitions": {"general": "General"},
-        }
-        with open(path / "metadata.json", "w") as f:
-            json.dump(metadata, f)
+        _write_dataset_files(path, self._dataset_files)
 
     def test_cli_accepts_evaluation_split_param(self):
         """CLI score command should accept --evaluation-split parameter."""
@@ -333,11 +388,7 @@ class TestCLISplitDiscipline(unittest.TestCase):
             tmppath = Path(tmpdir)
             self._create_dataset_with_splits(tmppath)
 
-            run = Run(
-                run_id="test",
-                entries=[RunEntry(query_id="q3", canonical_item_id="doc3", rank=1, score=0.9)],
-            )
-            save_run(run, tmppath / "run.json")
+            (tmppath / "run.json").write_bytes(self._run_q3_bytes)
 
             # Should not raise with valid split
             exit_code = main([
@@ -355,11 +406,7 @@ class TestCLISplitDiscipline(unittest.TestCase):
             tmppath = Path(tmpdir)
             self._create_dataset_with_splits(tmppath)
 
-            run = Run(
-                run_id="test",
-                entries=[RunEntry(query_id="q3", canonical_item_id="doc3", rank=1, score=0.9)],
-            )
-            save_run(run, tmppath / "run.json")
+            (tmppath / "run.json").write_bytes(self._run_q3_bytes)
 
             # Should not raise with valid workflow
             exit_code = main([
@@ -378,11 +425,7 @@ class TestCLISplitDiscipline(unittest.TestCase):
             tmppath = Path(tmpdir)
             self._create_dataset_with_splits(tmppath)
 
-            run = Run(
-                run_id="test",
-                entries=[RunEntry(query_id="q3", canonical_item_id="doc3", rank=1, score=0.9)],
-            )
-            save_run(run, tmppath / "run.json")
+            (tmppath / "run.json").write_bytes(self._run_q3_bytes)
 
             # argparse should reject 'test' as a choice for --selection-split
             # This will raise SystemExit(2) from argparse
@@ -404,11 +447,7 @@ class TestCLISplitDiscipline(unittest.TestCase):
             tmppath = Path(tmpdir)
             self._create_dataset_with_splits(tmppath)
 
-            run = Run(
-                run_id="test",
-                entries=[RunEntry(query_id="q3", canonical_item_id="doc3", rank=1, score=0.9)],
-            )
-            save_run(run, tmppath / "run.json")
+            (tmppath / "run.json").write_bytes(self._run_q3_bytes)
             summary_path = tmppath / "summary.json"
 
             exit_code = main([
@@ -459,6 +498,26 @@ class TestCLISplitDiscipline(unittest.TestCase):
                 result = json.load(f)
             self.assertEqual(result.get("query_count"), 1)  # Only q3
 
+    def test_cli_reuses_scorer_per_evaluation_split(self):
+        """Repeated scores on one split share a single filtered scorer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            self._create_dataset_with_splits(tmppath)
+            (tmppath / "run.json").write_bytes(self._run_q3_bytes)
+
+            cli = BenchmarkCLI(dataset_path=tmppath)
+            with patch(
+                "benchmark.benchmark_cli.BenchmarkScorer", wraps=BenchmarkScorer
+            ) as scorer_cls:
+                for _ in range(3):
+                    result = cli.score(
+                        run_path=tmppath / "run.json",
+                        output_path=tmppath / "output.json",
+                        evaluation_split="test",
+                    )
+            self.assertEqual(scorer_cls.call_count, 1)
+            self.assertEqual(result.query_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -66,6 +66,27 @@ class TestCanonicalizeId:
         result2 = canonicalize_id(None, "  Plan 014  ", "summary")
         assert result1 == result2
 
+    def test_repeated_topic_returns_same_interned_id(self):
+        """Repeated topics reuse one memoized, interned canonical ID."""
+        result1 = canonicalize_id(None, "Plan 014", None)
+        result2 = canonicalize_id(None, "  plan 014 ", None)
+        assert result1 == str(uuid5(NAMESPACE_DNS, "plan 014"))
+        assert result1 is result2
+
+    @pytest.mark.parametrize("topic,expected", [
+        ("plan 014", "plan 014"),
+        ("Plan 014", "plan 014"),
+        ("plan 014\t", "plan 014"),
+        ("\nplan 014", "plan 014"),
+        ("014", "014"),
+        ("plan ÉTÉ", "plan été"),
+        ("", ""),
+    ])
+    def test_normalize_topic(self, topic, expected):
+        """Fast path for normalized ASCII agrees with strip().lower()."""
+        from benchmark.benchmark_contract import normalize_topic
+        assert normalize_topic(topic) == expected
+
     def test_neither_topic_id_nor_topic_returns_none(self):
         """When both topic_id and topic are missing, return None (non-canonical)."""
         result = canonicalize_id(
@@ -167,6 +188,14 @@ class TestRunEntry:
         assert entry.score == 0.95
 
 
+    def test_run_entry_uses_slots(self):
+        """Contract dataclasses use __slots__, so instances carry no __dict__."""
+        entry = RunEntry("q001", "item-abc", 1, 0.95)
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = "nope"
+
+
 class TestRun:
     """Test Run dataclass representing a full benchmark run."""
 
@@ -197,6 +226,76 @@ class TestRun:
         assert len(by_query["q001"]) == 2
         assert len(by_query["q002"]) == 1
 
+    @pytest.mark.parametrize("query_order", [
+        ["q001", "q001", "q002"],          # contiguous per query
+        ["q001", "q002", "q001", "q003"],  # interleaved
+        [],
+    ])
+    def test_iter_by_query_matches_entries_by_query(self, query_order):
+        """iter_by_query yields the same groups, in the same order, as entries_by_query."""
+        run = Run(
+            run_id="test-run",
+            entries=[RunEntry(q, f"item-{i}", i, 0.5) for i, q in enumerate(query_order)],
+        )
+        assert list(run.iter_by_query()) == list(run.entries_by_query().items())
+
+    def test_run_to_arrays_groups_like_entries_by_query(self):
+        """The columnar view holds the same data and groups queries the same way."""
+        np = pytest.importorskip("numpy")
+        run = Run(
+            run_id="test-run",
+            entries=[
+                RunEntry("q002", "item-c", 1, 0.91),
+                RunEntry("q001", "item-a", 1, 0.95),
+                RunEntry("q002", "item-d", 2, 0.5),
+                RunEntry("q001", "item-b", 2, 0.82),
+            ]
+        )
+        arrays = run.to_arrays()
+        assert len(arrays) == 4
+        assert arrays.query_labels == ["q002", "q001"]
+        assert arrays.ranks.dtype == np.int32
+        assert arrays.scores.tolist() == [0.91, 0.95, 0.5, 0.82]
+
+        indices = arrays.indices_by_query()
+        by_query = run.entries_by_query()
+        assert indices.keys() == by_query.keys()
+        for query_id, idx in indices.items():
+            assert [run.entries[i] for i in idx] == by_query[query_id]
+        assert Run("empty").to_arrays().indices_by_query() == {}
+
+    def test_run_arrays_order_by_score(self):
+        """order_by_score ranks each query's entries by descending score, ties stable."""
+        pytest.importorskip("numpy")
+        run = Run(
+            run_id="test-run",
+            entries=[
+                RunEntry("q002", "item-a", 1, 0.1),
+                RunEntry("q001", "item-b", 1, 0.9),
+                RunEntry("q002", "item-c", 2, 0.5),
+                RunEntry("q002", "item-d", 3, 0.5),
+            ]
+        )
+        arrays = run.to_arrays()
+        order = arrays.order_by_score()
+        offsets = arrays.query_offsets()
+        ranked = {
+            label: [arrays.item_ids[i] for i in order[offsets[code]:offsets[code + 1]]]
+            for code, label in enumerate(arrays.query_labels)
+        }
+        assert ranked == {"q002": ["item-c", "item-d", "item-a"], "q001": ["item-b"]}
+
+    def test_run_arrays_float32_scores(self):
+        """score_dtype='float32' stores compact scores that rank the same."""
+        np = pytest.importorskip("numpy")
+        run = Run(
+            run_id="test-run",
+            entries=[RunEntry("q001", f"item-{i}", i, score) for i, score in enumerate([0.2, 0.9, 0.5])]
+        )
+        compact = run.to_arrays(score_dtype="float32")
+        assert compact.scores.dtype == np.float32
+        assert compact.order_by_score().tolist() == run.to_arrays().order_by_score().tolist() == [1, 2, 0]
+
 
 class TestRunSummary:
     """Test RunSummary schema for provenance and telemetry."""
@@ -311,6 +410,32 @@ class TestBenchmarkDataset:
         by_query = dataset.qrels_by_query()
         assert len(by_query["q001"]) == 2
 
+    def test_dataset_groupings_are_memoized_and_invalidated(self):
+        """Groupings are cached, read-only, and rebuilt when the source list changes."""
+        import pickle
+
+        dataset = BenchmarkDataset(
+            dataset_id="test",
+            version="1.0.0",
+            topics=[Topic("q001", "Query", ["a", "b"])],
+            qrels=[Qrel("q001", "item-a", 1)],
+            slice_definitions={}
+        )
+        first = dataset.qrels_by_query()
+        assert dataset.qrels_by_query()["q001"] is first["q001"]
+        with pytest.raises(TypeError):
+            first["q002"] = ()
+
+        dataset.qrels.append(Qrel("q002", "item-b", 1))
+        assert set(dataset.qrels_by_query()) == {"q001", "q002"}
+        dataset.topics = [Topic("q003", "Other", ["c"])]
+        assert set(dataset.topics_by_slice()) == {"c"}
+
+        # Caches are not part of equality or serialization, and survive pickling
+        assert pickle.loads(pickle.dumps(dataset)) == dataset
+        from benchmark.benchmark_contract import _json_default
+        assert "_qrels_by_query_cache" not in _json_default(dataset)
+
 
 class TestFileIO:
     """Test loading and saving benchmark artifacts."""
@@ -331,6 +456,328 @@ class TestFileIO:
         assert loaded.run_id == run.run_id
         assert len(loaded.entries) == 2
 
+    def test_jsonl_load_ignores_rejected_fadvise(self, tmp_path, monkeypatch):
+        """The sequential-read hint is best effort; OSError from posix_fadvise is ignored."""
+        import os
+
+        from benchmark.benchmark_contract import save_run_jsonl
+
+        def reject(*args):
+            raise OSError("fadvise not supported")
+
+        monkeypatch.setattr(os, "posix_fadvise", reject, raising=False)
+        monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+        run = Run(run_id="test-run", entries=[RunEntry("q001", "item-a", 1, 0.95)])
+        save_run_jsonl(run, tmp_path / "run.jsonl")
+        assert load_run(tmp_path / "run.jsonl") == run
+
+    def test_save_and_load_run_jsonl(self, tmp_path):
+        """Runs round-trip through JSON Lines; load_run dispatches on .jsonl."""
+        from benchmark.benchmark_contract import iter_run_entries_jsonl, save_run_jsonl
+
+        run = Run(
+            run_id="test-run",
+            entries=[
+                RunEntry("q001", "item-a", 1, 0.95),
+                RunEntry("q002", "item-b", 1, 0.82),
+            ]
+        )
+        filepath = tmp_path / "run.jsonl"
+        save_run_jsonl(run, filepath)
+
+        lines = filepath.read_text().splitlines()
+        assert json.loads(lines[0]) == {"run_id": "test-run"}
+        assert len(lines) == 3
+        assert list(iter_run_entries_jsonl(filepath)) == run.entries
+        assert load_run(filepath) == run
+
+    def test_jsonl_malformed_entry_raises(self, tmp_path):
+        """A JSON Lines entry missing a field raises KeyError, as on the JSON path."""
+        from benchmark.benchmark_contract import iter_run_entries_jsonl
+
+        filepath = tmp_path / "run.jsonl"
+        filepath.write_text(
+            '{"run_id": "test-run"}\n'
+            '{"query_id": "q001", "canonical_item_id": "item-a", "rank": 1, "score": 0.9}\n'
+            '{"qid": "q002", "canonical_item_id": "item-b", "rank": 1, "score": 0.8}\n'
+        )
+        with pytest.raises(KeyError, match="query_id"):
+            load_run(filepath)
+        with pytest.raises(KeyError, match="query_id"):
+            list(iter_run_entries_jsonl(filepath))
+
+        # A stray second header is a malformed entry too, not a skipped line
+        filepath.write_text('{"run_id": "test-run"}\n{"run_id": "other"}\n')
+        with pytest.raises(KeyError, match="query_id"):
+            load_run(filepath)
+
+    def test_loaded_ids_are_interned(self, tmp_path):
+        """IDs repeated across run entries and qrels load as one shared string."""
+        run_path = tmp_path / "run.json"
+        run_path.write_text(json.dumps({"run_id": "r", "entries": [
+            {"query_id": "q" + "001", "canonical_item_id": "item-" + "a", "rank": 1, "score": 0.9},
+            {"query_id": "q" + "001", "canonical_item_id": "item-" + "a", "rank": 2, "score": 0.8},
+        ]}))
+        qrels_path = tmp_path / "qrels.json"
+        qrels_path.write_text(json.dumps([{"query_id": "q001", "canonical_item_id": "item-a"}]))
+
+        first, second = load_run(run_path).entries
+        qrel = load_qrels(qrels_path)[0]
+        assert first.query_id is second.query_id is qrel.query_id
+        assert first.canonical_item_id is second.canonical_item_id is qrel.canonical_item_id
+
+    def test_run_loads_identically_without_orjson(self, tmp_path, monkeypatch):
+        """load_run gives the same Run through orjson and the stdlib fallback."""
+        import benchmark.benchmark_contract as contract
+
+        run = Run(run_id="test-run", entries=[RunEntry("q001", "item-a", 1, 0.95)])
+        filepath = tmp_path / "run.json"
+        save_run(run, filepath)
+
+        assert load_run(filepath) == run
+        monkeypatch.setattr(contract, "orjson", None)
+        assert load_run(filepath) == run
+
+    def test_large_run_is_stream_parsed(self, tmp_path, monkeypatch):
+        """Runs over the size threshold load through ijson with identical results."""
+        import benchmark.benchmark_contract as contract
+        pytest.importorskip("ijson")
+
+        run = Run(run_id="test-run", entries=[
+            RunEntry("q001", "item-a", 1, 0.95),
+            RunEntry("q002", "item-b", 1, 1.0),
+        ])
+        filepath = tmp_path / "run.json"
+        save_run(run, filepath)
+
+        monkeypatch.setattr(contract, "STREAMING_PARSE_MIN_BYTES", 0)
+        loaded = load_run(filepath)
+        assert loaded == run
+        assert all(type(e.score) is float for e in loaded.entries)
+
+    def test_large_qrels_are_stream_parsed(self, tmp_path, monkeypatch):
+        """Qrels over the size threshold load through ijson with identical results."""
+        import benchmark.benchmark_contract as contract
+        pytest.importorskip("ijson")
+
+        filepath = tmp_path / "qrels.json"
+        filepath.write_text(json.dumps([
+            {"query_id": "q001", "canonical_item_id": "item-a", "relevance": 2},
+            {"query_id": "q002", "canonical_item_id": "item-b"},
+        ]))
+        expected = load_qrels(filepath)
+
+        monkeypatch.setattr(contract, "STREAMING_PARSE_MIN_BYTES", 0)
+        loaded = load_qrels(filepath)
+        assert loaded == expected == [Qrel("q001", "item-a", 2), Qrel("q002", "item-b", 1)]
+        assert loaded[0].query_id is expected[0].query_id
+
+    def test_streamed_run_without_run_id_raises_key_error(self, tmp_path, monkeypatch):
+        """The ijson path reports a missing run_id as KeyError, like the other paths."""
+        import benchmark.benchmark_contract as contract
+        pytest.importorskip("ijson")
+
+        filepath = tmp_path / "run.json"
+        filepath.write_text(json.dumps({"entries": []}))
+        with pytest.raises(KeyError, match="run_id"):
+            load_run(filepath)
+
+        monkeypatch.setattr(contract, "STREAMING_PARSE_MIN_BYTES", 0)
+        with pytest.raises(KeyError, match="run_id"):
+            load_run(filepath)
+
+    def test_msgspec_and_dict_loaders_agree(self, tmp_path, monkeypatch):
+        """Typed msgspec decoding matches the dict-based loaders, and falls back on schema mismatch."""
+        import benchmark.benchmark_contract as contract
+        pytest.importorskip("msgspec")
+
+        run = Run(run_id="test-run", entries=[RunEntry("q001", "item-a", 1, 0.95)])
+        save_run(run, tmp_path / "run.json")
+        (tmp_path / "qrels.json").write_text(json.dumps([{"query_id": "q001", "canonical_item_id": "item-a"}]))
+        # A float rank is outside the declared schema; the lenient loader still accepts it
+        (tmp_path / "loose.json").write_text(json.dumps({"run_id": "r", "entries": [
+            {"query_id": "q001", "canonical_item_id": "item-a", "rank": 1.0, "score": 0.5},
+        ]}))
+
+        typed = [load_run(tmp_path / "run.json"), load_qrels(tmp_path / "qrels.json"), load_run(tmp_path / "loose.json")]
+        monkeypatch.setattr(contract, "msgspec", None)
+        assert typed == [load_run(tmp_path / "run.json"), load_qrels(tmp_path / "qrels.json"), load_run(tmp_path / "loose.json")]
+        assert typed[1] == [Qrel("q001", "item-a", 1)]
+
+    @pytest.mark.parametrize("records,expected", [
+        # Uniform records without the optional keys
+        ([{"query_id": "q1", "query_text": "a", "slice_ids": []}], [Topic("q1", "a", [])]),
+        # An optional key appearing only after the first record is kept
+        (
+            [{"query_id": "q1", "query_text": "a", "slice_ids": []},
+             {"query_id": "q2", "query_text": "b", "slice_ids": [], "split": "test"}],
+            [Topic("q1", "a", []), Topic("q2", "b", [], split="test")],
+        ),
+        # Same key count but a different key set
+        (
+            [{"query_id": "q1", "query_text": "a", "slice_ids": [], "notes": "n"},
+             {"query_id": "q2", "query_text": "b", "slice_ids": [], "split": "test"}],
+            [Topic("q1", "a", [], notes="n"), Topic("q2", "b", [], split="test")],
+        ),
+        # Unknown keys are ignored
+        ([{"query_id": "q1", "query_text": "a", "slice_ids": [], "extra": 1}], [Topic("q1", "a", [])]),
+    ])
+    def test_topics_load_with_mixed_optional_keys(self, tmp_path, monkeypatch, records, expected):
+        """The per-file key-presence path never drops or invents optional fields."""
+        import benchmark.benchmark_contract as contract
+
+        monkeypatch.setattr(contract, "msgspec", None)
+        filepath = tmp_path / "topics.json"
+        filepath.write_text(json.dumps(records))
+        assert load_topics(filepath) == expected
+
+    def test_topics_load_identically_without_orjson(self, tmp_path, monkeypatch):
+        """The stdlib json fallback yields the same topics as orjson."""
+        import benchmark.benchmark_contract as contract
+
+        filepath = tmp_path / "topics.json"
+        filepath.write_text(json.dumps([
+            {"query_id": "q001", "query_text": "Plan 014 – summaries", "slice_ids": ["a"], "split": "test"},
+        ]))
+
+        loaded = load_topics(filepath)
+        monkeypatch.setattr(contract, "orjson", None)
+        assert load_topics(filepath) == loaded
+        assert loaded[0].query_text == "Plan 014 – summaries"
+
+    def test_stdlib_loaders(self, tmp_path, monkeypatch):
+        """Without orjson or msgspec, the stdlib loaders give the same records."""
+        import benchmark.benchmark_contract as contract
+
+        monkeypatch.setattr(contract, "orjson", None)
+        monkeypatch.setattr(contract, "msgspec", None)
+        (tmp_path / "topics.json").write_text(json.dumps([
+            {"query_id": "q1", "query_text": "a", "slice_ids": [], "extra": {"nested": True}},
+        ]))
+        (tmp_path / "qrels.json").write_text(json.dumps([{"query_id": "q1", "canonical_item_id": "item-a"}]))
+        (tmp_path / "run.json").write_text(json.dumps({"run_id": "r", "entries": [
+            {"query_id": "q1", "canonical_item_id": "item-a", "rank": 1, "score": 0.5},
+        ]}))
+        (tmp_path / "bad.json").write_text(json.dumps([{"query_text": "a", "slice_ids": []}]))
+
+        assert load_topics(tmp_path / "topics.json") == [Topic("q1", "a", [])]
+        assert load_qrels(tmp_path / "qrels.json") == [Qrel("q1", "item-a", 1)]
+        assert load_run(tmp_path / "run.json") == Run("r", [RunEntry("q1", "item-a", 1, 0.5)])
+        with pytest.raises(KeyError):
+            load_topics(tmp_path / "bad.json")
+
+    def test_nested_record_like_values_load_identically_on_every_path(self, tmp_path, monkeypatch):
+        """Dicts nested inside a record stay dicts, with msgspec, orjson or only the stdlib."""
+        import benchmark.benchmark_contract as contract
+
+        (tmp_path / "topics.json").write_text(json.dumps([
+            {"query_id": "q1", "query_text": "a", "slice_ids": [], "notes": {"query_id": "zz"}},
+            {"query_id": "q2", "query_text": "b", "slice_ids": [],
+             "notes": {"query_id": "q9", "query_text": "c", "slice_ids": []}},
+        ]))
+        (tmp_path / "run.json").write_text(json.dumps({"run_id": "r", "entries": [
+            {"query_id": "q1", "canonical_item_id": "item-a", "rank": 1, "score": 0.5,
+             "extra": {"query_id": "q9", "canonical_item_id": "x", "rank": 2, "score": 0.1}},
+        ]}))
+        expected_topics = [
+            Topic("q1", "a", [], notes={"query_id": "zz"}),
+            Topic("q2", "b", [], notes={"query_id": "q9", "query_text": "c", "slice_ids": []}),
+        ]
+        expected_run = Run("r", [RunEntry("q1", "item-a", 1, 0.5)])
+
+        for disabled in ([], ["msgspec"], ["msgspec", "orjson"]):
+            for name in disabled:
+                monkeypatch.setattr(contract, name, None)
+            assert load_topics(tmp_path / "topics.json") == expected_topics, disabled
+            assert load_run(tmp_path / "run.json") == expected_run, disabled
+
+    def test_save_topics_matches_with_and_without_orjson(self, tmp_path, monkeypatch):
+        """Dataclasses serialize to the same JSON via orjson and the stdlib fallback."""
+        import benchmark.benchmark_contract as contract
+        from benchmark.benchmark_contract import save_topics
+
+        topics = [
+            Topic("q001", "First", ["a", "b"], notes="n", split="train"),
+            Topic("q002", "Second", []),
+        ]
+        save_topics(topics, tmp_path / "fast.json")
+        monkeypatch.setattr(contract, "orjson", None)
+        save_topics(topics, tmp_path / "stdlib.json")
+
+        fast = json.loads((tmp_path / "fast.json").read_text())
+        assert fast == json.loads((tmp_path / "stdlib.json").read_text())
+        assert fast[0] == {
+            "query_id": "q001",
+            "query_text": "First",
+            "slice_ids": ["a", "b"],
+            "notes": "n",
+            "expected_positive_count": None,
+            "split": "train",
+        }
+        assert load_topics(tmp_path / "fast.json") == topics
+
+    def test_run_and_dataset_writers_match_without_orjson(self, tmp_path, monkeypatch):
+        """save_run, save_run_jsonl and save_dataset write the same JSON either way."""
+        import benchmark.benchmark_contract as contract
+        from benchmark.benchmark_contract import save_dataset, save_run_jsonl
+
+        run = Run(run_id="test-run", entries=[RunEntry("q001", "item-a", 1, 0.95)])
+        dataset = BenchmarkDataset("ds", "1.0.0", [Topic("q001", "First", ["a"])], [Qrel("q001", "item-a")], {"a": "Slice A"})
+
+        for name in ("fast", "stdlib"):
+            if name == "stdlib":
+                monkeypatch.setattr(contract, "orjson", None)
+            save_run(run, tmp_path / f"{name}.json")
+            save_run_jsonl(run, tmp_path / f"{name}.jsonl")
+            save_dataset(dataset, tmp_path / name)
+
+        def parsed(path):
+            if path.suffix == ".jsonl":
+                return [json.loads(line) for line in path.read_text().splitlines()]
+            return json.loads(path.read_text())
+
+        for suffix in (".json", ".jsonl", "/metadata.json"):
+            assert parsed(tmp_path / f"fast{suffix}") == parsed(tmp_path / f"stdlib{suffix}")
+        assert load_run(tmp_path / "fast.jsonl") == run
+
+    def test_dataset_parquet_round_trip(self, tmp_path):
+        """Datasets saved as Parquet load back unchanged."""
+        pytest.importorskip("pyarrow")
+        from benchmark.benchmark_contract import load_dataset_parquet, save_dataset_parquet
+
+        dataset = BenchmarkDataset(
+            "ds", "1.0.0",
+            [
+                Topic("q001", "First", ["a", "b"], notes="n", expected_positive_count=2, split="train"),
+                Topic("q002", "Second", []),
+            ],
+            [Qrel("q001", "item-a"), Qrel("q001", "item-b", 3), Qrel("q002", "item-a", 0)],
+            {"a": "Slice A"},
+        )
+        save_dataset_parquet(dataset, tmp_path)
+
+        assert (tmp_path / "qrels.parquet").exists()
+        loaded = load_dataset_parquet(tmp_path)
+        assert loaded == dataset
+
+        # IDs are interned like the JSON loaders, so repeats share one string
+        first, second, _ = loaded.qrels
+        assert loaded.topics[0].query_id is first.query_id is second.query_id
+        assert first.canonical_item_id is loaded.qrels[2].canonical_item_id
+
+    def test_row_builders_cover_every_field(self):
+        """The save_* row builders emit exactly the dataclass fields, in order."""
+        from dataclasses import asdict
+
+        from benchmark.benchmark_contract import _qrel_rows, _run_entry_rows, _topic_rows
+
+        topic = Topic("q001", "First", ["a"], notes="n", expected_positive_count=1, split="train")
+        qrel = Qrel("q001", "item-a", 2)
+        entry = RunEntry("q001", "item-a", 1, 0.5)
+        for rows, obj in ((_topic_rows, topic), (_qrel_rows, qrel), (_run_entry_rows, entry)):
+            (row,) = rows([obj])
+            assert list(row.items()) == list(asdict(obj).items())
+
     def test_save_run_summary(self, tmp_path):
         """RunSummary can be saved to JSON."""
         summary = RunSummary(
@@ -357,6 +804,27 @@ class TestFileIO:
         assert data["run_id"] == "test"
         assert data["canonicalization_version"] == "v1"
 
+    def test_save_run_summary_drops_top_level_none(self, tmp_path, monkeypatch):
+        """None fields are omitted; nested values are written unchanged by both writers."""
+        import benchmark.benchmark_contract as contract
+
+        summary = RunSummary(
+            run_id="test", timestamp="2026-01-18T00:00:00+00:00", git_sha=None,
+            dataset_id="test", dataset_version="1.0.0", topics_version=None, qrels_version=None,
+            retrieval_contract_version=None, canonicalization_version="v1",
+            metrics={"Recall@5": 0.8}, k_values=[5], query_count=1, duration_ms=None,
+            per_slice_metrics={"chat": {"recall@5": 0.8, "note": None}},
+        )
+        save_run_summary(summary, tmp_path / "fast.json")
+        monkeypatch.setattr(contract, "orjson", None)
+        save_run_summary(summary, tmp_path / "stdlib.json")
+
+        data = json.loads((tmp_path / "fast.json").read_text())
+        assert data == json.loads((tmp_path / "stdlib.json").read_text())
+        assert "git_sha" not in data and "zero_edge_ratio" not in data
+        assert data["per_slice_metrics"] == {"chat": {"recall@5": 0.8, "note": None}}
+        assert data["k_values"] == [5]
+
 
 class TestCanonalizationVersionConstant:
     """Test that canonicalization version is properly defined."""
@@ -1,32 +1,36 @@
 """
 TDD tests for benchmark_scorer.py (Step 2: Scoring Harness)
 
-Tests for scoring harness using ir_measures + pytrec_eval.
+Tests for scoring harness using pytrec_eval (checked against ir_measures).
 Metrics: Recall@K, Precision@K, MRR, MAP@K, nDCG@K
 """
 
+import dataclasses
 import json
+import random
 import tempfile
 import unittest
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from benchmark.benchmark_contract import (
+    BenchmarkDataset,
+    Qrel,
+    Run,
+    RunEntry,
+    RunSummary,
+    Topic,
+)
 
 # TDD Red Phase: Import the module we're about to create
 from benchmark.benchmark_scorer import (
+    DEFAULT_K_VALUES,
     BenchmarkScorer,
     ScorerConfig,
     ScoreResult,
     compute_metrics,
     format_results_markdown,
-    DEFAULT_K_VALUES,
-)
-from benchmark.benchmark_contract import (
-    Topic,
-    Qrel,
-    Run,
-    RunEntry,
-    BenchmarkDataset,
-    RunSummary,
 )
 
 
@@ -205,6 +209,58 @@ class TestBenchmarkScorer(unittest.TestCase):
         result = scorer.score_run(partial_run)
         # Should still compute metrics (missing queries get 0)
         self.assertIn("recall@5", result.aggregate_metrics)
+        self.assertEqual(result.per_query_metrics["q3"]["mrr"], 0.0)
+
+    def test_scorer_matches_ir_measures(self):
+        """Direct pytrec_eval scoring reports the same per-query rows as ir_measures."""
+        try:
+            import ir_measures
+            from ir_measures import AP, RR, Precision, Recall, nDCG
+        except ImportError:
+            self.skipTest("ir_measures not installed")
+        from benchmark.benchmark_scorer import _build_trec_qrels, _build_trec_run
+
+        partial_run = Run(run_id="partial", entries=self.run.entries[:3])
+        measures = [m @ k for k in (1, 5) for m in (Recall, Precision, AP, nDCG)] + [RR]
+        renamed = {"R": "recall", "P": "precision", "AP": "map", "nDCG": "ndcg", "RR": "mrr"}
+
+        def metric_name(measure):
+            base, at, k = str(measure).partition("@")
+            return renamed[base] + at + k
+
+        expected = [
+            (r.query_id, metric_name(r.measure), r.value)
+            for r in ir_measures.iter_calc(
+                measures, _build_trec_qrels(self.dataset), _build_trec_run(partial_run)
+            )
+        ]
+
+        result = BenchmarkScorer(self.dataset, ScorerConfig(k_values=[1, 5])).score_run(partial_run)
+        actual = [
+            (qid, name, value)
+            for qid, metrics in result.per_query_metrics.items()
+            for name, value in metrics.items()
+        ]
+        self.assertEqual(sorted(actual), sorted(expected))
+
+    def test_scorer_result_cache(self):
+        """Re-scoring the same run hits the opt-in cache; replaced entries are rescored."""
+        scorer = BenchmarkScorer(self.dataset, ScorerConfig(result_cache_size=1))
+        first = scorer.score_run(self.run)
+        self.assertIs(scorer.score_run(self.run), first)
+
+        self.run.entries = self.run.entries[:1]
+        rescored = scorer.score_run(self.run)
+        self.assertIsNot(rescored, first)
+        self.assertLess(rescored.aggregate_metrics["recall@5"], first.aggregate_metrics["recall@5"])
+
+        # Size 1: scoring another run evicts this one
+        scorer.score_run(Run(run_id="other", entries=self.run.entries))
+        self.assertIsNot(scorer.score_run(self.run), rescored)
+
+    def test_scorer_result_cache_disabled_by_default(self):
+        scorer = BenchmarkScorer(self.dataset, ScorerConfig())
+        self.assertIsNot(scorer.score_run(self.run), scorer.score_run(self.run))
 
     def test_scorer_per_slice_metrics(self):
         """Scorer should compute per-slice aggregate metrics."""
@@ -226,8 +282,8 @@ class TestBenchmarkScorer(unittest.TestCase):
 class TestComputeMetrics(unittest.TestCase):
     """Tests for the compute_metrics helper function."""
 
-    def test_compute_metrics_with_ir_measures(self):
-        """compute_metrics should use ir_measures for computation."""
+    def test_compute_metrics_with_pytrec_eval(self):
+        """compute_metrics should use pytrec_eval for computation."""
         qrels = {"q1": {"doc1": 1, "doc2": 1}}
         run = {"q1": {"doc1": 0.9, "doc2": 0.8, "doc99": 0.7}}
         metrics = compute_metrics(qrels, run, k_values=[5])
@@ -442,6 +498,38 @@ class TestPlan113LabelShapeStatistics(unittest.TestCase):
         for field_name in expected_fields:
             self.assertTrue(hasattr(result.label_shape_stats, field_name), f"Missing field: {field_name}")
 
+    def test_label_shape_stats_are_plain_python_numbers(self):
+        """Stats are JSON-serializable ints and floats with the documented values."""
+        from benchmark.benchmark_scorer import BenchmarkScorer, ScorerConfig
+        stats = BenchmarkScorer(self.dataset, ScorerConfig()).score_run(Run(run_id="test", entries=[])).label_shape_stats
+        # [0, 1, 1, 2, 4]
+        self.assertEqual((stats.min, stats.max, stats.total_queries), (0, 4, 5))
+        self.assertEqual((stats.mean, stats.median, stats.p95), (1.6, 1.0, 2.0))
+        self.assertIs(type(stats.min), int)
+        self.assertIs(type(stats.mean), float)
+        json.dumps(dataclasses.asdict(stats))
+
+    def test_result_dataclasses_use_slots(self):
+        """Scorer result and config dataclasses carry no per-instance __dict__."""
+        from benchmark.benchmark_scorer import BenchmarkScorer, ScorerConfig
+        result = BenchmarkScorer(self.dataset, ScorerConfig()).score_run(Run(run_id="test", entries=[]))
+        for obj in (result, result.config, result.label_shape_stats):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_label_shape_stats_computed_once_per_scorer(self):
+        """Repeated score_run calls reuse the dataset stats but return independent copies."""
+        from unittest import mock
+
+        from benchmark.benchmark_scorer import BenchmarkScorer, ScorerConfig
+        scorer = BenchmarkScorer(self.dataset, ScorerConfig())
+        run = Run(run_id="test", entries=[])
+        with mock.patch.object(scorer, "_compute_label_shape_stats", wraps=scorer._compute_label_shape_stats) as compute:
+            first = scorer.score_run(run).label_shape_stats
+            second = scorer.score_run(run).label_shape_stats
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
 
 class TestPlan113MacroAveraging(unittest.TestCase):
     """
@@ -580,6 +668,91 @@ class TestPlan113MacroAveraging(unittest.TestCase):
         self.assertEqual(slice_keys, sorted(slice_keys))
 
 
+class TestParallelScoring(unittest.TestCase):
+    """n_workers > 1 must produce the same metrics as in-process scoring."""
+
+    def test_parallel_matches_serial(self):
+        rng = random.Random(113)
+        topics = [
+            Topic(
+                query_id=f"q{i}",
+                query_text=f"Query {i}",
+                slice_ids=rng.sample(["general", "code", "docs", "chat"], rng.randint(1, 2)),
+            )
+            for i in range(300)
+        ]
+        # 1-4 positives per query, so aggregate weights vary
+        qrels = [
+            Qrel(query_id=f"q{i}", canonical_item_id=f"doc{rng.randrange(50)}", relevance=1)
+            for i in range(300)
+            for _ in range(rng.randint(1, 4))
+        ]
+        dataset = BenchmarkDataset(
+            dataset_id="test",
+            version="1.0",
+            topics=topics,
+            qrels=qrels,
+            slice_definitions={"general": "General"},
+        )
+        # Shuffled query order; every 7th judged query is missing from the run
+        # and q300-q309 are unjudged
+        query_ids = [f"q{i}" for i in range(310) if i % 7]
+        rng.shuffle(query_ids)
+        run = Run(run_id="test", entries=[
+            RunEntry(query_id=qid, canonical_item_id=f"doc{rng.randrange(50)}", rank=j + 1, score=1.0 - j / 10)
+            for qid in query_ids
+            for j in range(5)
+        ])
+
+        serial = BenchmarkScorer(dataset, ScorerConfig(k_values=[1, 5])).score_run(run)
+        parallel = BenchmarkScorer(dataset, ScorerConfig(k_values=[1, 5], n_workers=3)).score_run(run)
+
+        # Exact equality, including dict order and the last bits of float sums
+        self.assertEqual(list(parallel.per_query_metrics.items()), list(serial.per_query_metrics.items()))
+        self.assertEqual(list(parallel.aggregate_metrics.items()), list(serial.aggregate_metrics.items()))
+        self.assertEqual(list(parallel.macro_metrics.items()), list(serial.macro_metrics.items()))
+        self.assertEqual(list(parallel.per_slice_metrics.items()), list(serial.per_slice_metrics.items()))
+        self.assertEqual(parallel.query_count, serial.query_count)
+        self.assertEqual(parallel.to_json(), serial.to_json())
+
+    def test_score_runs_parallel_matches_serial(self):
+        topics = [
+            Topic(query_id=f"q{i}", query_text=f"Query {i}", slice_ids=["general"])
+            for i in range(4)
+        ]
+        qrels = [
+            Qrel(query_id=f"q{i}", canonical_item_id=f"doc{i}", relevance=1)
+            for i in range(4)
+        ]
+        dataset = BenchmarkDataset(
+            dataset_id="test",
+            version="1.0",
+            topics=topics,
+            qrels=qrels,
+            slice_definitions={"general": "General"},
+        )
+        runs = [
+            Run(run_id=f"run{shift}", entries=[
+                RunEntry(query_id=f"q{i}", canonical_item_id=f"doc{(i + shift + j) % 4}", rank=j + 1, score=1.0 - j / 10)
+                for i in range(4)
+                for j in range(2)
+            ])
+            for shift in range(3)
+        ]
+        scorer = BenchmarkScorer(dataset, ScorerConfig(k_values=[1, 5]))
+
+        serial = scorer.score_runs(runs)
+        parallel = scorer.score_runs(runs, n_workers=2)
+
+        self.assertEqual(len(parallel), len(runs))
+        for p, s in zip(parallel, serial):
+            self.assertEqual(p.per_query_metrics, s.per_query_metrics)
+            self.assertEqual(p.aggregate_metrics, s.aggregate_metrics)
+            self.assertIs(p.config, scorer.config)
+        # Results follow the order of the input runs
+        self.assertNotEqual(serial[0].aggregate_metrics, serial[1].aggregate_metrics)
+
+
 class TestScorerOutputArtifacts(unittest.TestCase):
     """Tests for output artifact generation."""
 
@@ -610,6 +783,37 @@ class TestScorerOutputArtifacts(unittest.TestCase):
         self.assertIn("aggregate_metrics", parsed)
         self.assertIn("per_slice_metrics", parsed)
 
+    def test_json_bytes_match_json_text(self):
+        """to_json_bytes() must carry the same content and key order as to_json()."""
+        scorer = BenchmarkScorer(self.dataset, ScorerConfig())
+        result = scorer.score_run(self.run)
+        from_bytes = json.loads(result.to_json_bytes())
+        from_text = json.loads(result.to_json())
+        self.assertEqual(from_bytes, from_text)
+        self.assertEqual(list(from_bytes), list(from_text))
+
+    def test_compact_json_matches_pretty_json(self):
+        """pretty=False drops whitespace only; content and key order are unchanged."""
+        scorer = BenchmarkScorer(self.dataset, ScorerConfig())
+        result = scorer.score_run(self.run)
+        pretty = result.to_json()
+        compact = result.to_json(pretty=False)
+        self.assertNotIn("\n", compact)
+        self.assertEqual(list(json.loads(compact).items()), list(json.loads(pretty).items()))
+        self.assertEqual(json.loads(result.to_json_bytes(pretty=False)), json.loads(compact))
+
+    def test_json_matches_stdlib_encoder(self):
+        """to_json() parses to the same content and key order with or without orjson."""
+        from benchmark import benchmark_scorer
+        scorer = BenchmarkScorer(self.dataset, ScorerConfig())
+        result = scorer.score_run(self.run)
+        accelerated = result.to_json()
+        with patch.object(benchmark_scorer, "orjson", None):
+            stdlib = result.to_json()
+            stdlib_bytes = result.to_json_bytes()
+        self.assertEqual(list(json.loads(accelerated).items()), list(json.loads(stdlib).items()))
+        self.assertEqual(stdlib_bytes.decode("utf-8"), stdlib)
+
     def test_scorer_can_emit_run_summary(self):
         """Scorer should generate a RunSummary with required provenance."""
         scorer = BenchmarkScorer(self.dataset, ScorerConfig())
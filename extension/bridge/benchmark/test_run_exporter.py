@@ -123,6 +123,20 @@ class TestExportRetrievalResultsToRun(unittest.TestCase):
         self.assertEqual(entries_q1[2].canonical_item_id, "low")
         self.assertEqual(entries_q1[2].rank, 3)
 
+    def test_export_keeps_retrieval_order_for_tied_scores(self):
+        """Tied scores should keep their original retrieval order."""
+        results = {
+            "q1": [
+                MockRetrievalResult(topic_id="first", score=0.5),
+                MockRetrievalResult(topic_id="top", score=0.9),
+                MockRetrievalResult(topic_id="second", score=0.5),
+            ],
+        }
+        run = export_retrieval_results_to_run(results, run_id="test")
+        ids = [e.canonical_item_id for e in run.entries]
+        self.assertEqual(ids, ["top", "first", "second"])
+        self.assertEqual([e.rank for e in run.entries], [1, 2, 3])
+
     def test_export_skips_non_canonical_results(self):
         """Export should skip results without canonical IDs."""
         results = {